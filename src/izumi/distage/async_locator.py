@@ -14,6 +14,9 @@ from .model import DIKey, InstanceKey, Plan
 
 T = TypeVar("T")
 
+# Sentinel distinguishing a missing instance from a cached None
+_MISS = object()
+
 
 class AsyncLocator(Locator):
     """
@@ -27,6 +30,16 @@ class AsyncLocator(Locator):
     Resources are released in reverse order when exiting the context.
     """
 
+    __slots__ = (
+        "_plan",
+        "_instances",
+        "_get_cached",
+        "_parent",
+        "_owners",
+        "_lifecycle_resources",
+        "_closed",
+    )
+
     def __init__(
         self,
         plan: Plan,
@@ -47,7 +60,10 @@ class AsyncLocator(Locator):
         """
         self._plan = plan
         self._instances: dict[DIKey, object] = instances or {}
+        self._get_cached = self._instances.get
         self._parent = parent
+        # Ancestor locators already found to hold keys this locator does not produce
+        self._owners: dict[DIKey, Locator] = {}
         self._lifecycle_resources = lifecycle_resources
         self._closed = False
 
@@ -79,10 +95,15 @@ class AsyncLocator(Locator):
         if self._closed:
             raise RuntimeError("Cannot access closed AsyncLocator")
 
-        if key not in self._instances:
-            # Try to resolve it from parent
+        instance = self._get_cached(key, _MISS)
+        if instance is _MISS:
+            # Try to resolve it from parent, remembering which ancestor holds it
+            owner = self._owners.get(key)
+            if owner is not None:
+                return owner.get(key)
             if self._parent.has_key(key):
-                return self._parent.get(key)
+                owner = self._owners[key] = self._parent._owner_of(key)
+                return owner.get(key)
             elif isinstance(key, InstanceKey) and AutoLoggerManager.should_auto_inject_logger(key):
                 # Create a generic logger using stack introspection
                 import logging
@@ -96,7 +117,7 @@ class AsyncLocator(Locator):
             else:
                 raise ValueError(f"No binding found for {key}")
 
-        return self._instances[key]
+        return instance
 
     def find(self, key: DIKey) -> Any | None:
         """
@@ -108,11 +129,16 @@ class AsyncLocator(Locator):
         Returns:
             An instance of the requested type or None if not found
         """
-        try:
-            return self.get(key)
-        except (ValueError, RuntimeError):
+        if self._closed:
             return None
 
+        instance = self._get_cached(key, _MISS)
+        if instance is not _MISS:
+            return instance
+        if not self.has(key):
+            return None
+        return self.get(key)
+
     def has(self, key: DIKey) -> bool:
         """
         Check if an instance can be resolved for the given key.
@@ -134,13 +160,11 @@ class AsyncLocator(Locator):
         if not isinstance(key, InstanceKey):
             return False
 
-        # Check if we have a binding for it in the plan
-        if self._plan.has_binding(key):
+        # Check if the plan produces it
+        if self._plan.has_operation(key):
             return True
 
         # Check if it's an auto-injectable logger
-        from .logger_injection import AutoLoggerManager
-
         if AutoLoggerManager.should_auto_inject_logger(key):
             return True
 
@@ -178,8 +202,13 @@ class AsyncLocator(Locator):
 
         from .introspection import SignatureIntrospector
 
-        # Extract dependency information from the function signature
-        dependencies = SignatureIntrospector.extract_from_callable(func)
+        # Extract dependency information from the function signature, parameterless
+        # functions need no introspection
+        dependencies = (
+            []
+            if SignatureIntrospector.takes_no_arguments(func)
+            else SignatureIntrospector.extract_from_callable(func)
+        )
 
         # Resolve each dependency
         resolved_args: list[Any] = []
@@ -5,7 +5,7 @@ Core components for the Chibi Izumi dependency injection framework.
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, TypeVar
 
 from .functoid import (
@@ -21,6 +21,18 @@ from .tag import Tag
 T = TypeVar("T")
 
 
+def _is_factory_type(target_type: Any) -> bool:
+    """Check whether the target type is Factory[T], which is bound for assisted injection."""
+    if not hasattr(target_type, "__origin__"):
+        return False
+    from .factory import Factory
+
+    try:
+        return target_type.__origin__ is Factory
+    except AttributeError:
+        return False
+
+
 @dataclass(frozen=True)
 class ModuleDef:
     """
@@ -33,24 +45,33 @@ class ModuleDef:
     bindings: list[Binding]
     lookup_operations: list[Any]
     _set_element_counters: dict[type, int]
+    _version: int = field(default=0, repr=False, compare=False)
 
     def __init__(self) -> None:
         # Use object.__setattr__ since we're frozen
         object.__setattr__(self, "bindings", [])
         object.__setattr__(self, "lookup_operations", [])
         object.__setattr__(self, "_set_element_counters", {})
+        object.__setattr__(self, "_version", 0)
+
+    @property
+    def version(self) -> int:
+        """Get the modification counter, bumped whenever a binding or lookup is added."""
+        return self._version
 
     def add_binding(self, binding: Binding) -> None:
         """Add a binding to this module."""
         # Since we're frozen, we need to create a new list
         new_bindings = self.bindings + [binding]
         object.__setattr__(self, "bindings", new_bindings)
+        object.__setattr__(self, "_version", self._version + 1)
 
     def add_lookup_operation(self, lookup_op: Any) -> None:
         """Add a lookup operation to this module."""
         # Since we're frozen, we need to create a new list
         new_lookup_operations = self.lookup_operations + [lookup_op]
         object.__setattr__(self, "lookup_operations", new_lookup_operations)
+        object.__setattr__(self, "_version", self._version + 1)
 
     def get_next_set_element_counter(self, target_type: type) -> int:
         """Get and increment the counter for a specific set type."""
@@ -62,6 +83,25 @@ class ModuleDef:
         """Create a binding builder for the given type."""
         return BindingBuilder(target_type, self)
 
+    def bind_value(self, target_type: type[T] | Any, value: T, name: str | None = None) -> None:
+        """Bind the type to a specific instance, without going through builders."""
+        self._bind(target_type, name, value_functoid(value))
+
+    def bind_type(self, target_type: type[T] | Any, cls: type[T], name: str | None = None) -> None:
+        """Bind the type to a class that will be instantiated, without going through builders."""
+        self._bind(target_type, name, class_functoid(cls))
+
+    def bind_func(
+        self, target_type: type[T] | Any, factory: Callable[..., T], name: str | None = None
+    ) -> None:
+        """Bind the type to a factory function, without going through builders."""
+        self._bind(target_type, name, function_functoid(factory))
+
+    def _bind(self, target_type: type[T] | Any, name: str | None, functoid: Functoid[T]) -> None:
+        """Add an untagged binding for the given type and name."""
+        key = InstanceKey(target_type, name)
+        self.add_binding(Binding(key, functoid, set(), _is_factory_type(target_type)))
+
     def many(self, target_type: type[T]) -> SetBindingBuilder[T]:
         """Create a set binding builder for the given type."""
         return SetBindingBuilder(target_type, self)
@@ -120,14 +160,7 @@ class BindingBuilder[T]:
                         activation_tags.add(tag)
 
             # Check if this is a Factory[T] binding
-            is_factory = False
-            if hasattr(self._target_type, "__origin__"):
-                from .factory import Factory
-
-                try:
-                    is_factory = self._target_type.__origin__ is Factory  # type: ignore[union-attr]
-                except AttributeError:
-                    is_factory = False
+            is_factory = _is_factory_type(self._target_type)
 
             # Extract lifecycle if present
             lifecycle = getattr(functoid, "_lifecycle", None)
@@ -167,14 +200,7 @@ class BindingBuilder[T]:
                             activation_tags.add(tag)
 
                 # Check if this is a Factory[T] binding
-                is_factory = False
-                if hasattr(self._target_type, "__origin__"):
-                    from .factory import Factory
-
-                    try:
-                        is_factory = self._target_type.__origin__ is Factory  # type: ignore[union-attr]
-                    except AttributeError:
-                        is_factory = False
+                is_factory = _is_factory_type(self._target_type)
 
                 # Extract lifecycle if present
                 lifecycle = getattr(functoid, "_lifecycle", None)
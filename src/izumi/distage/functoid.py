@@ -53,6 +53,7 @@ class Functoid[T]:
             is_async: Whether this functoid's call_fn is async
         """
         self._keys_fn = keys_fn
+        self._keys: list[InstanceKey] | None = None
         self._sig_fn = sig_fn
         self._call_fn = call_fn
         self._name = name
@@ -64,7 +65,11 @@ class Functoid[T]:
 
     def keys(self) -> list[InstanceKey]:
         """Return a list of DIKey dependencies that this functoid requires."""
-        return self._keys_fn()
+        # Dependencies are fixed once the functoid is created, so compute the keys once
+        keys = self._keys
+        if keys is None:
+            keys = self._keys = self._keys_fn()
+        return list(keys)
 
     def sig(self) -> list[Any]:  # Returns list[DependencyInfo]
         """Return a list of DependencyInfo with parameter names for this functoid."""
@@ -10,8 +10,16 @@ from collections.abc import Callable
 from typing import Any, TypeVar
 
 from .locator_base import Locator
-from .logger_injection import AutoLoggerManager
-from .model import DependencyGraph, DIKey, ExecutableOp, InstanceKey, Plan
+from .logger_injection import AutoLoggerManager, LoggerLocationIntrospector
+from .model import (
+    CreateFactory,
+    DependencyGraph,
+    DIKey,
+    ExecutableOp,
+    InstanceKey,
+    Plan,
+    Provide,
+)
 from .planner_input import PlannerInput
 
 T = TypeVar("T")
@@ -71,10 +79,15 @@ class Injector:
             planner_input = PlannerInput(modules, roots)
             return self.plan(planner_input)
         else:
-            # Normal usage: plan(PlannerInput)
+            # Normal usage: plan(PlannerInput), reusing the plan cached on the input if still valid
+            cached = input.cached_plan(self._parent_locator)
+            if cached is not None:
+                return cached
             graph = self._build_graph(input)
             topology = graph.get_topological_order()
-            return Plan(graph, input.roots, input.activation, topology)
+            plan = Plan(graph, input.roots, input.activation, topology)
+            input.cache_plan(self._parent_locator, plan)
+            return plan
 
     def produce_run(self, input: PlannerInput, func: Callable[..., T]) -> T:
         """
@@ -116,20 +129,7 @@ class Injector:
         Returns:
             A Locator containing all resolved instances
         """
-        instances: dict[DIKey, Any] = {}
-
-        def resolve_instance(key: InstanceKey) -> Any:
-            """Resolve a dependency and return an instance."""
-            if plan.has_operation(key):
-                return instances[key]
-            else:
-                return self._parent_locator.get(key)  # pyright: ignore[reportUnknownVariableType]
-
-        # Resolve all dependencies in topological order
-        for binding_key in plan.get_execution_order():
-            assert binding_key not in instances
-            instance = self._create_instance(binding_key, plan, instances, resolve_instance)
-            instances[binding_key] = instance
+        instances = self._produce_instances(plan, {})
 
         from .locator_impl import LocatorImpl
 
@@ -153,34 +153,32 @@ class Injector:
             async with injector.produce_async(plan) as locator:
                 result = await locator.run(my_async_function)
         """
-        instances: dict[DIKey, Any] = {}
+        slots = plan.slots()
+        values: list[Any] = []
         lifecycle_resources: list[
             tuple[InstanceKey, Any, Any]
         ] = []  # [(key, instance, lifecycle), ...]
 
         def resolve_instance(key: InstanceKey) -> Any:
             """Resolve a dependency and return an instance."""
-            if plan.has_operation(key):
-                return instances[key]
+            slot = slots.get(key)
+            if slot is not None:
+                return values[slot]
             else:
                 return self._parent_locator.get(key)  # pyright: ignore[reportUnknownVariableType]
 
-        # Resolve all dependencies in topological order
-        for binding_key in plan.get_execution_order():
-            assert binding_key not in instances
-            instance = await self._create_instance_async(
-                binding_key, plan, instances, resolve_instance
+        # Resolve all dependencies in topological order, slot i is filled by step i
+        for binding_key, operation, dependencies in plan.compiled():
+            instance = await self._execute_operation_async(
+                operation, dependencies, values, resolve_instance
             )
-            instances[binding_key] = instance
+            values.append(instance)
 
             # Track lifecycle resources for cleanup
-            operations = plan.graph.get_operations()
-            operation = operations.get(binding_key)
-            if operation:
-                from .model.operations import Provide
+            if isinstance(operation, Provide) and operation.binding.lifecycle:
+                lifecycle_resources.append((binding_key, instance, operation.binding.lifecycle))
 
-                if isinstance(operation, Provide) and operation.binding.lifecycle:
-                    lifecycle_resources.append((binding_key, instance, operation.binding.lifecycle))
+        instances: dict[DIKey, Any] = dict(zip(slots, values, strict=True))
 
         from .async_locator import AsyncLocator
 
@@ -237,115 +235,93 @@ class Injector:
 
         return graph
 
-    def _create_instance(
-        self,
-        key: InstanceKey,
-        plan: Plan,
-        instances: dict[DIKey, Any],  # noqa: ARG002
-        resolve_fn: Callable[[InstanceKey], Any],
-    ) -> Any:
-        """Create an instance for the given key."""
-        # Get operation for this key
-        operations = plan.graph.get_operations()
-        operation = operations.get(key)
+    def _produce_instances(
+        self, plan: Plan, preresolved_deps: dict[InstanceKey, Any]
+    ) -> dict[DIKey, Any]:
+        """Execute the compiled steps of a Plan, skipping keys that are already resolved."""
+        slots = plan.slots()
+        values: list[Any] = []
 
-        if not operation:
-            # Check parent locator if available
-            if not self._parent_locator.is_empty():
-                try:
-                    return self._parent_locator.get(key)  # pyright: ignore[reportUnknownVariableType]
-                except ValueError:
-                    pass  # Parent doesn't have it either, fall through to error
+        def resolve_instance(key: InstanceKey) -> Any:
+            """Resolve a dependency and return an instance."""
+            slot = slots.get(key)
+            if slot is not None:
+                return values[slot]
+            elif key in preresolved_deps:
+                return preresolved_deps[key]
+            else:
+                return self._parent_locator.get(key)  # pyright: ignore[reportUnknownVariableType]
 
-            raise ValueError(f"No operation found for {key}")
+        # Resolve all dependencies in topological order, slot i is filled by step i
+        for binding_key, operation, dependencies in plan.compiled():
+            if binding_key in preresolved_deps:
+                values.append(preresolved_deps[binding_key])
+            else:
+                values.append(
+                    self._execute_operation(operation, dependencies, values, resolve_instance)
+                )
 
-        return self._execute_operation(operation, resolve_fn)
+        instances: dict[DIKey, Any] = dict(preresolved_deps.items())
+        instances.update(zip(slots, values, strict=True))
+        return instances
 
     def _execute_operation(
-        self, operation: ExecutableOp, resolve_fn: Callable[[InstanceKey], Any]
+        self,
+        operation: ExecutableOp,
+        dependencies: tuple[tuple[InstanceKey, int], ...],
+        values: list[Any],
+        resolve_fn: Callable[[InstanceKey], Any],
     ) -> Any:
         """Execute an operation with resolved dependencies."""
-        from .model import CreateFactory
-
         # Special handling for CreateFactory operations
         if isinstance(operation, CreateFactory):
             # Set the resolve function for the factory operation
             operation.resolve_fn = resolve_fn
             return operation.execute({})
 
-        # Build resolved dependencies map for other operations
-        resolved_deps: dict[InstanceKey, Any] = {}
-        for dep_key in operation.dependencies():
-            try:
-                resolved_deps[dep_key] = resolve_fn(dep_key)
-            except ValueError:
-                # Check if this is an auto-injectable logger
-                if AutoLoggerManager.should_auto_inject_logger(dep_key):
-                    # Get the target class that's requesting the logger
-                    target_key = operation.key()
-                    target_class = target_key.target_type
-
-                    # Determine logger name from target class
-                    if hasattr(target_class, "__name__"):
-                        from .logger_injection import LoggerLocationIntrospector
-
-                        module_name = LoggerLocationIntrospector.get_module_name_from_string(
-                            target_class.__module__
-                            if hasattr(target_class, "__module__")
-                            else "__unknown__"
-                        )
-                        logger_name = f"{module_name}.{target_class.__name__}"
-                    else:
-                        from .logger_injection import LoggerLocationIntrospector
-
-                        logger_name = LoggerLocationIntrospector.get_logger_location_name()
-
-                    resolved_deps[dep_key] = logging.getLogger(logger_name)
-                else:
-                    # Re-raise the original error for non-logger dependencies
-                    raise
-
-        return operation.execute(resolved_deps)
+        return operation.execute(
+            self._resolve_dependencies(operation, dependencies, values, resolve_fn)
+        )
 
-    async def _create_instance_async(
+    async def _execute_operation_async(
         self,
-        key: InstanceKey,
-        plan: Plan,
-        instances: dict[DIKey, Any],  # noqa: ARG002
+        operation: ExecutableOp,
+        dependencies: tuple[tuple[InstanceKey, int], ...],
+        values: list[Any],
         resolve_fn: Callable[[InstanceKey], Any],
-    ) -> Any:
-        """Create an instance for the given key, supporting async operations."""
-        # Get operation for this key
-        operations = plan.graph.get_operations()
-        operation = operations.get(key)
-
-        if not operation:
-            # Check parent locator if available
-            if not self._parent_locator.is_empty():
-                try:
-                    return self._parent_locator.get(key)  # pyright: ignore[reportUnknownVariableType]
-                except ValueError:
-                    pass  # Parent doesn't have it either, fall through to error
-
-            raise ValueError(f"No operation found for {key}")
-
-        return await self._execute_operation_async(operation, resolve_fn)
-
-    async def _execute_operation_async(
-        self, operation: ExecutableOp, resolve_fn: Callable[[InstanceKey], Any]
     ) -> Any:
         """Execute an operation with resolved dependencies, supporting async operations."""
-        from .model import CreateFactory
-
         # Special handling for CreateFactory operations
         if isinstance(operation, CreateFactory):
             # Set the resolve function for the factory operation
             operation.resolve_fn = resolve_fn
             return operation.execute({})
 
-        # Build resolved dependencies map for other operations
+        # Execute the operation
+        result = operation.execute(
+            self._resolve_dependencies(operation, dependencies, values, resolve_fn)
+        )
+
+        # If the result is a coroutine (async operation), await it
+        if inspect.iscoroutine(result):
+            return await result
+
+        return result
+
+    def _resolve_dependencies(
+        self,
+        operation: ExecutableOp,
+        dependencies: tuple[tuple[InstanceKey, int], ...],
+        values: list[Any],
+        resolve_fn: Callable[[InstanceKey], Any],
+    ) -> dict[InstanceKey, Any]:
+        """Build the resolved dependencies map for an operation."""
         resolved_deps: dict[InstanceKey, Any] = {}
-        for dep_key in operation.dependencies():
+        for dep_key, slot in dependencies:
+            # Dependencies produced by the same plan are read directly from their slot
+            if slot >= 0:
+                resolved_deps[dep_key] = values[slot]
+                continue
             try:
                 resolved_deps[dep_key] = resolve_fn(dep_key)
             except ValueError:
@@ -357,8 +333,6 @@ class Injector:
 
                     # Determine logger name from target class
                     if hasattr(target_class, "__name__"):
-                        from .logger_injection import LoggerLocationIntrospector
-
                         module_name = LoggerLocationIntrospector.get_module_name_from_string(
                             target_class.__module__
                             if hasattr(target_class, "__module__")
@@ -366,8 +340,6 @@ class Injector:
                         )
                         logger_name = f"{module_name}.{target_class.__name__}"
                     else:
-                        from .logger_injection import LoggerLocationIntrospector
-
                         logger_name = LoggerLocationIntrospector.get_logger_location_name()
 
                     resolved_deps[dep_key] = logging.getLogger(logger_name)
@@ -375,14 +347,7 @@ class Injector:
                     # Re-raise the original error for non-logger dependencies
                     raise
 
-        # Execute the operation
-        result = operation.execute(resolved_deps)
-
-        # If the result is a coroutine (async operation), await it
-        if inspect.iscoroutine(result):
-            return await result
-
-        return result
+        return resolved_deps
 
     def create_locator_with_preresolved(
         self, plan: Plan, preresolved_deps: dict[InstanceKey, Any]
@@ -397,30 +362,11 @@ class Injector:
         Returns:
             A Locator containing all resolved instances
         """
-        instances: dict[InstanceKey, Any] = preresolved_deps.copy()
-
-        def resolve_instance(key: InstanceKey) -> Any:
-            """Resolve a dependency and return an instance."""
-            if key in instances:
-                return instances[key]
-            elif plan.has_operation(key):
-                # This should have been resolved already in topological order
-                return instances[key]
-            else:
-                return self._parent_locator.get(key)  # pyright: ignore[reportUnknownVariableType]
-
-        # Resolve all dependencies in topological order (skip already resolved ones)
-        instances_dict: dict[DIKey, Any] = instances  # type: ignore[assignment]
-        for binding_key in plan.get_execution_order():
-            if binding_key not in instances_dict:
-                instance = self._create_instance(
-                    binding_key, plan, instances_dict, resolve_instance
-                )
-                instances_dict[binding_key] = instance
+        instances = self._produce_instances(plan, preresolved_deps)
 
         from .locator_impl import LocatorImpl
 
-        return LocatorImpl(plan, instances_dict, self._parent_locator)
+        return LocatorImpl(plan, instances, self._parent_locator)
 
     @classmethod
     def inherit(cls, parent_locator: Locator) -> Injector:
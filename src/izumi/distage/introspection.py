@@ -8,6 +8,7 @@ import inspect
 from collections.abc import Callable
 from dataclasses import fields, is_dataclass
 from typing import Annotated, Any, get_args, get_origin, get_type_hints
+from weakref import WeakKeyDictionary
 
 from .model import Id, InstanceKey
 
@@ -39,23 +40,44 @@ class DependencyInfo:
         return f"DependencyInfo({self.name}, {self.type_hint}, {self.is_optional})"
 
 
+# Dependencies per class constructor or per callable, weakly keyed so that local classes and
+# functions can still be collected. Class entries leave out the constructor's self parameter.
+# Extractions whose type hints could not be resolved are not cached, since forward
+# references may become resolvable later.
+_dependencies: WeakKeyDictionary[Any, tuple[DependencyInfo, ...]] = WeakKeyDictionary()
+
+
 class SignatureIntrospector:
     """Analyzes function/class signatures to extract dependency information."""
 
     @staticmethod
     def extract_from_class(target_class: type) -> list[DependencyInfo]:
-        """Extract dependencies from a class constructor."""
+        """Extract dependencies from a class constructor, computed once per class."""
+        return list(
+            SignatureIntrospector._cached_dependencies(
+                target_class, SignatureIntrospector._extract_from_class
+            )
+        )
+
+    @staticmethod
+    def _extract_from_class(target_class: type) -> tuple[list[DependencyInfo], bool]:
+        """
+        Extract dependencies from a class constructor without caching.
+
+        Returns the dependencies and whether the constructor's type hints could be resolved.
+        """
         if is_dataclass(target_class):
-            return SignatureIntrospector._extract_from_dataclass(target_class)
+            return SignatureIntrospector._extract_from_dataclass(target_class), True
 
         try:
             init_method: Any = getattr(target_class, "__init__", None)  # pyright: ignore[reportUnknownArgumentType]
             if init_method:
-                return SignatureIntrospector.extract_from_callable(init_method, skip_self=True)
+                dependencies, resolved = SignatureIntrospector._extract_from_callable(init_method)
+                return [dep for dep in dependencies if dep.name != "self"], resolved
         except AttributeError:
             pass
 
-        return []
+        return [], True
 
     @staticmethod
     def _extract_from_dataclass(target_class: type) -> list[DependencyInfo]:
@@ -105,7 +127,44 @@ class SignatureIntrospector:
     def extract_from_callable(
         func: Callable[..., Any], skip_self: bool = False
     ) -> list[DependencyInfo]:
-        """Extract dependencies from a callable."""
+        """Extract dependencies from a callable, computed once per callable."""
+        if isinstance(func, type):
+            # The cache entry of a class holds its constructor's dependencies instead
+            dependencies = tuple(SignatureIntrospector._extract_from_callable(func)[0])
+        else:
+            dependencies = SignatureIntrospector._cached_dependencies(
+                func, SignatureIntrospector._extract_from_callable
+            )
+        if skip_self:
+            return [dep for dep in dependencies if dep.name != "self"]
+        return list(dependencies)
+
+    @staticmethod
+    def _cached_dependencies(
+        target: Any, extract: Callable[[Any], tuple[list[DependencyInfo], bool]]
+    ) -> tuple[DependencyInfo, ...]:
+        """Look up the dependencies of a class or callable, extracting and caching them on a miss."""
+        try:
+            cached = _dependencies.get(target)
+        except TypeError:
+            # Not weak-referenceable, e.g. a generic alias or a slot wrapper of a builtin type
+            return tuple(extract(target)[0])
+
+        if cached is None:
+            dependencies, resolved = extract(target)
+            cached = tuple(dependencies)
+            if resolved:
+                _dependencies[target] = cached
+        return cached
+
+    @staticmethod
+    def _extract_from_callable(func: Callable[..., Any]) -> tuple[list[DependencyInfo], bool]:
+        """
+        Extract dependencies from a callable without caching.
+
+        Returns the dependencies and whether the callable's type hints could be resolved.
+        """
+        resolved = True
         try:
             signature = inspect.signature(func)
             # Use raw annotations to preserve Annotated metadata
@@ -117,15 +176,13 @@ class SignatureIntrospector:
             except (NameError, AttributeError):
                 # Fall back to raw annotations if type hints fail
                 resolved_type_hints = raw_annotations
+                resolved = False
         except (ValueError, TypeError):
-            return []
+            return [], True
 
         dependencies: list[DependencyInfo] = []
 
         for param_name, param in signature.parameters.items():
-            if skip_self and param_name == "self":
-                continue
-
             # First try raw annotations to preserve Annotated metadata
             raw_type_hint = raw_annotations.get(param_name, Any)
 
@@ -171,7 +228,18 @@ class SignatureIntrospector:
             )
             dependencies.append(dep)
 
-        return dependencies
+        return dependencies, resolved
+
+    @staticmethod
+    def takes_no_arguments(func: Callable[..., Any]) -> bool:
+        """Check cheaply whether a plain function declares no parameters at all."""
+        code = getattr(func, "__code__", None)
+        return (
+            code is not None
+            and code.co_argcount == 0
+            and code.co_kwonlyargcount == 0
+            and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        )
 
     @staticmethod
     def _is_optional_type(type_hint: Any) -> bool:
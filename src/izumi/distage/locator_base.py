@@ -5,7 +5,7 @@ Abstract Locator interface and implementations.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, TypeVar
 
 from .model import DIKey, Plan
@@ -21,6 +21,9 @@ class Locator(ABC):
     based on a validated Plan.
     """
 
+    # Weak-referenceable, so that caches keyed by parent locator do not keep them alive
+    __slots__ = ("__weakref__",)
+
     @abstractmethod
     def has_key_locally(self, key: DIKey) -> bool:
         """Check if this locator has the key in its local instances."""
@@ -48,6 +51,22 @@ class Locator(ABC):
             ValueError: If no binding exists for the requested key
         """
 
+    def get_many(self, keys: Iterable[DIKey]) -> list[Any]:
+        """
+        Get instances for several keys at once, in the order the keys are given.
+
+        Args:
+            keys: The DIKeys to resolve
+
+        Returns:
+            The instances for the requested keys
+
+        Raises:
+            ValueError: If no binding exists for one of the requested keys
+        """
+        get = self.get
+        return [get(key) for key in keys]
+
     @abstractmethod
     def find(self, key: DIKey) -> Any | None:
         """
@@ -101,6 +120,15 @@ class Locator(ABC):
     def has_parent(self) -> bool:
         """Check if this locator has a parent."""
 
+    def _owner_of(self, key: DIKey) -> Locator:
+        """Get the nearest locator in this chain holding key locally, or self if none does."""
+        locator: Locator | None = self
+        while locator is not None:
+            if locator.has_key_locally(key):
+                return locator
+            locator = locator.parent
+        return self
+
     @staticmethod
     def empty() -> Locator:
         """
@@ -119,6 +147,8 @@ class LocatorEmpty(Locator):
     This is a singleton that serves as a null object for parent locators.
     """
 
+    __slots__ = ()
+
     _instance: LocatorEmpty | None = None
 
     def __init__(self) -> None:
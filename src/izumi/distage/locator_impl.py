@@ -9,10 +9,13 @@ from typing import Any, TypeVar
 
 from .locator_base import Locator
 from .logger_injection import AutoLoggerManager
-from .model import DIKey, InstanceKey, Plan
+from .model import DIKey, InstanceKey, Plan, Provide
 
 T = TypeVar("T")
 
+# Sentinel distinguishing a missing instance from a cached None
+_MISS = object()
+
 
 class LocatorImpl(Locator):
     """
@@ -25,6 +28,8 @@ class LocatorImpl(Locator):
     this locator will check parent locators for missing dependencies.
     """
 
+    __slots__ = ("_plan", "_instances", "_get_cached", "_parent", "_owners")
+
     def __init__(
         self,
         plan: Plan,
@@ -41,7 +46,10 @@ class LocatorImpl(Locator):
         """
         self._plan = plan
         self._instances: dict[DIKey, object] = instances or {}
+        self._get_cached = self._instances.get
         self._parent = parent
+        # Ancestor locators already found to hold keys this locator does not produce
+        self._owners: dict[DIKey, Locator] = {}
 
     def has_key_locally(self, key: DIKey) -> bool:
         """Check if this locator has the key in its local instances."""
@@ -68,10 +76,15 @@ class LocatorImpl(Locator):
         Raises:
             ValueError: If no binding exists for the requested key
         """
-        if key not in self._instances:
-            # Try to resolve it on-demand
+        instance = self._get_cached(key, _MISS)
+        if instance is _MISS:
+            # Try to resolve it on-demand, remembering which ancestor holds it
+            owner = self._owners.get(key)
+            if owner is not None:
+                return owner.get(key)
             if self._parent.has_key(key):
-                return self._parent.get(key)
+                owner = self._owners[key] = self._parent._owner_of(key)
+                return owner.get(key)
             elif isinstance(key, InstanceKey) and AutoLoggerManager.should_auto_inject_logger(key):
                 # Create a generic logger using stack introspection
                 import logging
@@ -85,7 +98,7 @@ class LocatorImpl(Locator):
             else:
                 raise ValueError(f"No binding found for {key}")
 
-        return self._instances[key]
+        return instance
 
     def find(self, key: DIKey) -> Any | None:
         """
@@ -97,10 +110,12 @@ class LocatorImpl(Locator):
         Returns:
             An instance of the requested type or None if not found
         """
-        try:
-            return self.get(key)
-        except ValueError:
+        instance = self._get_cached(key, _MISS)
+        if instance is not _MISS:
+            return instance
+        if not self.has(key):
             return None
+        return self.get(key)
 
     def has(self, key: DIKey) -> bool:
         """
@@ -120,13 +135,11 @@ class LocatorImpl(Locator):
         if not isinstance(key, InstanceKey):
             return False
 
-        # Check if we have a binding for it in the plan
-        if self._plan.has_binding(key):
+        # Check if the plan produces it
+        if self._plan.has_operation(key):
             return True
 
         # Check if it's an auto-injectable logger
-        from .logger_injection import AutoLoggerManager
-
         if AutoLoggerManager.should_auto_inject_logger(key):
             return True
 
@@ -171,16 +184,17 @@ class LocatorImpl(Locator):
             for key, instance in self._instances.items():
                 if isinstance(key, InstanceKey):
                     # Find the binding for this key
-                    operations = self._plan.graph.get_operations()
-                    if key in operations:
-                        from .model.operations import Provide
-
-                        operation = operations[key]
-                        if isinstance(operation, Provide) and operation.binding.lifecycle:
-                            lifecycle_resources.append((instance, operation.binding.lifecycle))
-
-            # Extract dependency information from the function signature
-            dependencies = SignatureIntrospector.extract_from_callable(func)
+                    operation = self._plan.get_operation(key)
+                    if isinstance(operation, Provide) and operation.binding.lifecycle:
+                        lifecycle_resources.append((instance, operation.binding.lifecycle))
+
+            # Extract dependency information from the function signature, parameterless
+            # functions need no introspection
+            dependencies = (
+                []
+                if SignatureIntrospector.takes_no_arguments(func)
+                else SignatureIntrospector.extract_from_callable(func)
+            )
 
             # Resolve each dependency
             resolved_args: list[Any] = []
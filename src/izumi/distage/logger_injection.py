@@ -7,6 +7,7 @@ where they are requested, eliminating the need for manual logger setup.
 
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
 from types import FrameType
@@ -15,6 +16,9 @@ from typing import Any
 from .functoid import function_functoid
 from .model import Binding, InstanceKey
 
+# Module-level reference so hot checks avoid the attribute lookup on the logging module
+_LOGGER_CLS = logging.Logger
+
 
 class LoggerLocationIntrospector:
     """Introspects the call stack to determine where a logger is being requested."""
@@ -27,66 +31,73 @@ class LoggerLocationIntrospector:
         Returns a location name suitable for logger naming in the format:
         module_name.class_name or module_name.function_name
         """
-        # Walk up the call stack to find the first frame outside the DI system
+        # Walk up the call stack to find the first frame outside the DI system,
+        # starting from our caller and reading code objects directly
         frame = inspect.currentframe()
         if frame is None:
             return "__unknown__"
 
         try:
-            # Skip frames within the DI system and look for the first meaningful user code
-            frames_to_check: list[FrameType] = []
-            current_frame = frame.f_back
+            # Single pass over the stack, skipping frames within the DI system. A constructor
+            # is where DI happens, so the first user constructor wins immediately; otherwise
+            # prefer the first meaningful user frame, then the first user frame at all.
+            first_frame: FrameType | None = None
+            meaningful_frame: FrameType | None = None
+            current_frame: FrameType | None = frame.f_back
             while current_frame is not None:
-                filename: str = current_frame.f_code.co_filename
-                # Skip frames within the distage package and other internal frames
-                if (
-                    "/distage/" not in filename
-                    and "\\distage\\" not in filename
-                    and not filename.endswith("beartype")
-                    and "<" not in filename  # Skip dynamic code frames
-                ):
-                    frames_to_check.append(current_frame)
+                code = current_frame.f_code
+                if not LoggerLocationIntrospector._is_internal_filename(code.co_filename):
+                    function_name = code.co_name
+
+                    # Look for constructor calls first, as that's where DI happens
+                    if function_name == "__init__":
+                        # For constructors, try to get a more specific name including the class
+                        class_name = LoggerLocationIntrospector._get_class_name_from_frame(
+                            current_frame
+                        )
+                        if class_name:
+                            module_name = LoggerLocationIntrospector.get_module_name_from_string(
+                                code.co_filename
+                            )
+                            return f"{module_name}.{class_name}"
+                        return LoggerLocationIntrospector._extract_location_from_frame(
+                            current_frame
+                        )
+
+                    if first_frame is None:
+                        first_frame = current_frame
+
+                    # Skip internal methods and test methods (for cleaner names) but allow main functions
+                    if (
+                        meaningful_frame is None
+                        and not function_name.startswith("_")
+                        and function_name != "<module>"
+                        and not function_name.startswith("test_")
+                    ):
+                        meaningful_frame = current_frame
                 current_frame = current_frame.f_back
 
-            # Look for the best frame - prefer constructors and meaningful user code
-            for check_frame in frames_to_check:
-                frame_filename: str = check_frame.f_code.co_filename
-                frame_function_name: str = check_frame.f_code.co_name
-
-                # Look for constructor calls first, as that's where DI happens
-                if frame_function_name == "__init__":
-                    # For constructors, try to get a more specific name including the class
-                    class_name = LoggerLocationIntrospector._get_class_name_from_frame(check_frame)
-                    module_name = LoggerLocationIntrospector.get_module_name_from_string(
-                        frame_filename
-                    )
-                    if class_name:
-                        return f"{module_name}.{class_name}"
-                    return LoggerLocationIntrospector._extract_location_from_frame(check_frame)
-
-            # If no constructor found, look for other meaningful user code
-            for check_frame in frames_to_check:
-                frame_function_name2: str = check_frame.f_code.co_name
-
-                # Skip internal methods but allow main functions
-                if (
-                    not frame_function_name2.startswith("_")
-                    and frame_function_name2 not in ["<module>"]
-                    and not frame_function_name2.startswith(
-                        "test_"
-                    )  # Skip test methods for cleaner names
-                ):
-                    return LoggerLocationIntrospector._extract_location_from_frame(check_frame)
-
-            # If no good frame found, use the first available frame
-            if frames_to_check:
-                return LoggerLocationIntrospector._extract_location_from_frame(frames_to_check[0])
+            # If no constructor found, use other meaningful user code, or the first available frame
+            best_frame = meaningful_frame or first_frame
+            if best_frame is not None:
+                return LoggerLocationIntrospector._extract_location_from_frame(best_frame)
 
             return "__unknown__"
         finally:
             # Clean up frame references to avoid memory leaks
             del frame
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_internal_filename(filename: str) -> bool:
+        """Check if a frame's filename belongs to the DI system or to dynamic code."""
+        return (
+            "/distage/" in filename
+            or "\\distage\\" in filename
+            or filename.endswith("beartype")
+            or "<" in filename  # Skip dynamic code frames
+        )
+
     @staticmethod
     def _extract_location_from_frame(frame: FrameType) -> str:
         """Extract a meaningful location name from a stack frame."""
@@ -106,23 +117,19 @@ class LoggerLocationIntrospector:
             return f"{module_name}.{function_name}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_module_name_from_string(filename: str) -> str:
         """Extract module name from a filename."""
-        # Handle different path separators by normalizing path
-        import os
-
-        # Normalize path separators to work on all systems
-        normalized_path = filename.replace("\\", "/")
-        name = os.path.basename(normalized_path)
+        # Take everything after the last separator, accepting both POSIX and Windows paths
+        separator = max(filename.rfind("/"), filename.rfind("\\"))
+        name = filename[separator + 1 :]
 
         # Remove .py extension
         if name.endswith(".py"):
             name = name[:-3]
 
         # Handle special cases
-        if name == "__main__":
-            return "__main__"
-        elif name == "<stdin>":
+        if name == "<stdin>":
             return "__interactive__"
         elif name.startswith("<"):
             return "__dynamic__"
@@ -139,21 +146,9 @@ class LoggerLocationIntrospector:
             return type(self_obj).__name__
         elif "cls" in local_vars:
             cls_obj = local_vars["cls"]
-            if inspect.isclass(cls_obj):
+            if isinstance(cls_obj, type):
                 return cls_obj.__name__
 
-        code = frame.f_code
-        if code.co_varnames and len(code.co_varnames) > 0:
-            first_param = code.co_varnames[0]
-            if first_param == "self" and first_param in local_vars:
-                obj = local_vars[first_param]
-                if hasattr(obj, "__class__"):
-                    return str(obj.__class__.__name__)
-            elif first_param == "cls" and first_param in local_vars:
-                obj = local_vars[first_param]
-                if inspect.isclass(obj):
-                    return str(obj.__name__)
-
         return None
 
 
@@ -162,7 +157,12 @@ class AutoLoggerManager:
 
     @staticmethod
     def create_logger_factory(logger_name: str) -> Any:
-        """Create a factory function that creates a logger with the given name."""
+        """
+        Create a factory function that creates a logger with the given name.
+
+        The logger is looked up on every call, so a patched or reconfigured
+        logging.getLogger is always honored.
+        """
 
         def logger_factory() -> logging.Logger:
             return logging.getLogger(logger_name)
@@ -187,7 +187,7 @@ class AutoLoggerManager:
         factory = AutoLoggerManager.create_logger_factory(location_name)
 
         # Create the binding key for the named logger
-        logger_key = InstanceKey(logging.Logger, logger_name)
+        logger_key = InstanceKey(_LOGGER_CLS, logger_name)
 
         # Create the functoid
         functoid = function_functoid(factory)
@@ -207,7 +207,7 @@ class AutoLoggerManager:
             True if this key should trigger automatic logger injection
         """
         return (
-            key.target_type is logging.Logger
+            key.target_type is _LOGGER_CLS
             and key.name is None  # Only auto-inject for unnamed logger dependencies
         )
 
@@ -224,4 +224,4 @@ class AutoLoggerManager:
             A new DIKey pointing to the location-specific logger
         """
         logger_name = f"__logger__.{location_name}"
-        return InstanceKey(logging.Logger, logger_name)
+        return InstanceKey(_LOGGER_CLS, logger_name)
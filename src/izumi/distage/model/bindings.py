@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from ..functoid import Functoid
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Binding:
     """A dependency injection binding."""
 
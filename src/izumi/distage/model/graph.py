@@ -4,7 +4,7 @@ Dependency graph formation and validation.
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
@@ -36,7 +36,7 @@ class MissingBindingError(Exception):
         super().__init__(msg)
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """A node in the dependency graph."""
 
@@ -59,6 +59,8 @@ class DependencyGraph:
         self._operations: dict[InstanceKey, ExecutableOp] = {}
         self._nodes: dict[InstanceKey, GraphNode] = {}
         self._set_bindings: dict[InstanceKey, list[Binding]] = defaultdict(list)
+        # Set element bindings indexed by element key, kept in sync with _set_bindings
+        self._set_element_bindings: dict[InstanceKey, Binding] = {}
         self._set_lookup_operations: dict[InstanceKey, list[Lookup]] = defaultdict(list)
         self._all_set_keys: set[InstanceKey] = set()  # Track all set keys ever registered
         self._validated = False
@@ -68,11 +70,12 @@ class DependencyGraph:
         # Check if this is a set element binding using SetElementKey
         if isinstance(binding.key, SetElementKey):
             self._set_bindings[binding.key.set_key].append(binding)
+            self._set_element_bindings.setdefault(binding.key.element_key, binding)
             self._all_set_keys.add(binding.key.set_key)
         else:
-            # Group alternatives by type only (ignore tag for activation purposes)
-            type_key = InstanceKey(binding.key.target_type, None)
-            self._alternative_bindings[type_key].append(binding)
+            # Group alternatives by key (ignore tag for activation purposes), so that
+            # unnamed and named bindings of the same type never compete with each other
+            self._alternative_bindings[binding.key].append(binding)
 
             # If this is the first binding or an untagged binding, also store in main bindings
             if binding.key not in self._bindings or not binding.activation_tags:
@@ -100,12 +103,16 @@ class DependencyGraph:
             return binding
 
         # Then check set element bindings
+        return self._set_element_bindings.get(key)
+
+    def _reindex_set_element_bindings(self) -> None:
+        """Rebuild the element key index after _set_bindings has been replaced."""
+        index: dict[InstanceKey, Binding] = {}
         for set_bindings in self._set_bindings.values():
             for binding in set_bindings:
-                if isinstance(binding.key, SetElementKey) and binding.key.element_key == key:
-                    return binding
-
-        return None
+                if isinstance(binding.key, SetElementKey):
+                    index.setdefault(binding.key.element_key, binding)
+        self._set_element_bindings = index
 
     def get_set_bindings(self, key: InstanceKey) -> list[Binding]:
         """Get all set bindings for a key."""
@@ -161,10 +168,15 @@ class DependencyGraph:
         # Use all set keys that were ever registered, even if all elements were filtered out
         for set_key in self._all_set_keys:
             element_keys: list[InstanceKey] = []
+            element_values: list[Any] = []
 
             # Add elements from bindings
             bindings = self._set_bindings.get(set_key, [])
             for binding in bindings:
+                # Plain values are known now, freeze them into the set instead of providing them
+                if binding.functoid.original_value is not None:
+                    element_values.append(binding.functoid.original_value)
+                    continue
                 # Create Provide operation for each set element
                 if isinstance(binding.key, SetElementKey):
                     element_key = binding.key.element_key
@@ -178,7 +190,7 @@ class DependencyGraph:
                 element_keys.append(lookup_op.key())
 
             # Create CreateSet operation to collect all elements (even if empty)
-            self._operations[set_key] = CreateSet(set_key, element_keys)
+            self._operations[set_key] = CreateSet(set_key, element_keys, frozenset(element_values))
 
     def validate(self) -> None:
         """Validate the dependency graph."""
@@ -221,6 +233,9 @@ class DependencyGraph:
 
     def _check_missing_dependencies(self) -> None:
         """Check for missing dependencies."""
+        # Imported here to avoid a cycle: logger_injection depends on the model package
+        from ..logger_injection import AutoLoggerManager
+
         for node in self._nodes.values():
             # Skip dependency validation for factory operations
             # Factory operations are expected to have missing dependencies (assisted injection)
@@ -230,8 +245,6 @@ class DependencyGraph:
             for dep_key in node.dependencies:
                 if dep_key not in self._operations:
                     # Check if this is an auto-injectable logger
-                    from ..logger_injection import AutoLoggerManager
-
                     if AutoLoggerManager.should_auto_inject_logger(dep_key):
                         # Skip validation for auto-injectable loggers
                         continue
@@ -239,6 +252,9 @@ class DependencyGraph:
 
     def _check_missing_dependencies_with_parent(self, parent_locator: Any) -> None:
         """Check for missing dependencies, allowing parent locator to provide them."""
+        # Imported here to avoid a cycle: logger_injection depends on the model package
+        from ..logger_injection import AutoLoggerManager
+
         for node in self._nodes.values():
             # Skip dependency validation for factory operations
             # Factory operations are expected to have missing dependencies (assisted injection)
@@ -248,8 +264,6 @@ class DependencyGraph:
             for dep_key in node.dependencies:
                 if dep_key not in self._operations:
                     # Check if this is an auto-injectable logger
-                    from ..logger_injection import AutoLoggerManager
-
                     if AutoLoggerManager.should_auto_inject_logger(dep_key):
                         # Skip validation for auto-injectable loggers
                         continue
@@ -307,32 +321,34 @@ class DependencyGraph:
         if not self._validated:
             self.validate()
 
-        in_degree: dict[InstanceKey, int] = defaultdict(int)
+        # Work on integer node ids: in-degrees and adjacency become plain lists,
+        # so the loop below does no hashing
+        keys = list(self._nodes)
+        index = {key: i for i, key in enumerate(keys)}
+        edges: list[list[int]] = [
+            [index[dep_key] for dep_key in node.dependencies if dep_key in index]
+            for node in self._nodes.values()
+        ]
 
         # Calculate in-degrees
-        for node in self._nodes.values():
-            for dep_key in node.dependencies:
-                if dep_key in self._nodes:
-                    in_degree[dep_key] += 1
+        in_degree = [0] * len(keys)
+        for targets in edges:
+            for target in targets:
+                in_degree[target] += 1
 
         # Initialize queue with nodes that have no dependencies
-        queue: deque[InstanceKey] = deque()
-        for key in self._nodes:
-            if in_degree[key] == 0:
-                queue.append(key)
+        queue = [i for i, degree in enumerate(in_degree) if degree == 0]
 
-        result: list[InstanceKey] = []
+        head = 0
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+            for target in edges[current]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
 
-        while queue:
-            key = queue.popleft()
-            result.append(key)
-
-            node = self._nodes[key]
-            for dep_key in node.dependencies:
-                if dep_key in self._nodes:
-                    in_degree[dep_key] -= 1
-                    if in_degree[dep_key] == 0:
-                        queue.append(dep_key)
+        result = [keys[i] for i in queue]
 
         if len(result) != len(self._nodes):
             # This shouldn't happen if circular dependency check passed
@@ -394,6 +410,7 @@ class DependencyGraph:
             if filtered_bindings_list:
                 filtered_set_bindings[set_key] = filtered_bindings_list
         self._set_bindings = filtered_set_bindings
+        self._reindex_set_element_bindings()
 
         # Filter out weak regular bindings that don't have non-weak counterparts
         filtered_bindings: dict[InstanceKey, Binding] = {}
@@ -424,21 +441,10 @@ class DependencyGraph:
                 return
             visited.add(key)
 
-            # Find the type key for this instance key
-            type_key = InstanceKey(key.target_type, None)
-
-            # Get alternative bindings for this type
-            alternatives = self._alternative_bindings.get(type_key, [])
-
-            # IMPORTANT: Filter alternatives to only include bindings that match the requested key's name
+            # Get alternative bindings for exactly this key, including its name
             # This ensures that unnamed dependencies don't get resolved to named bindings
             # For example, logger: Logger should not resolve to logger: Annotated[Logger, Id("name")]
-            if alternatives:
-                alternatives = [
-                    binding
-                    for binding in alternatives
-                    if isinstance(binding.key, InstanceKey) and binding.key.name == key.name
-                ]
+            alternatives = self._alternative_bindings.get(key)
 
             if not alternatives:
                 # No alternatives, check if we have a direct binding
@@ -550,4 +556,5 @@ class DependencyGraph:
         self._operations = filtered_operations
         self._bindings = filtered_bindings
         self._set_bindings = filtered_set_bindings
+        self._reindex_set_element_bindings()
         self._validated = False
@@ -4,20 +4,40 @@ DIKey implementation for dependency injection.
 
 from __future__ import annotations
 
+import sys
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypeVar
 
 T = TypeVar("T")
 
 
+# Canonical Id instance per name
+_INTERNED_IDS: dict[str, Id] = {}
+
+
 class Id:
-    """Annotation for named dependencies using typing.Annotated."""
+    """
+    Annotation for named dependencies using typing.Annotated.
+
+    Ids are interned: creating an Id with a name that was seen before returns the
+    existing instance, so comparing equal Ids reduces to an identity check.
+    """
+
+    def __new__(cls, value: str) -> Id:
+        id_ = _INTERNED_IDS.get(value)
+        if id_ is None:
+            id_ = object.__new__(cls)
+            _INTERNED_IDS[value] = id_
+        return id_
 
     def __init__(self, value: str):
         self.value = value
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         return isinstance(other, Id) and self.value == other.value
 
     def __hash__(self) -> int:
@@ -26,8 +46,11 @@ class Id:
     def __repr__(self) -> str:
         return f"Id({self.value!r})"
 
+    def __reduce__(self) -> tuple[type[Id], tuple[str]]:
+        return Id, (self.value,)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DIKey(ABC):
     """Abstract base class for dependency injection keys."""
 
@@ -44,17 +67,53 @@ class DIKey(ABC):
         return InstanceKey.of(target_type, name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False, weakref_slot=True)
 class InstanceKey(DIKey):
-    """A key that identifies a specific dependency in the object graph."""
+    """
+    A key that identifies a specific dependency in the object graph.
+
+    Keys are interned: constructing a key for the very same type object and an equal
+    name as one that is still alive returns the existing instance, so dict lookups
+    between keys mostly reduce to identity checks. Types that are equal but distinct,
+    such as Optional[int] and int | None, get keys of their own so that a key always
+    keeps the type it was created with.
+    """
 
     target_type: type
     name: str | None = None
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __new__(cls, target_type: type, name: str | None = None) -> InstanceKey:
+        interned = _INTERNED_KEYS.get((target_type, name))
+        if interned is not None and interned.target_type is target_type:
+            return interned
+        key = object.__new__(cls)
+        # Intern names so that key comparisons mostly reduce to identity checks
+        if name is not None:
+            name = sys.intern(name)
+        object.__setattr__(key, "target_type", target_type)
+        object.__setattr__(key, "name", name)
+        # Keys are immutable and hashed on every dict access, so hash them once
+        object.__setattr__(key, "_hash", hash((target_type, name)))
+        if interned is None:
+            _INTERNED_KEYS[(target_type, name)] = key
+        return key
+
+    def __init__(self, target_type: type, name: str | None = None) -> None:
+        # Fields are set once in __new__, interned keys must not be reinitialized
+        pass
+
+    def __reduce__(self) -> tuple[type[InstanceKey], tuple[type, str | None]]:
+        return InstanceKey, (self.target_type, self.name)
 
     @classmethod
     def of(cls, target_type: type[T], name: str | None = None) -> InstanceKey:
         """Create a DIKey for the given type and optional name."""
-        return cls(target_type, name)
+        # Already interned keys are returned without going through the constructor
+        key = _INTERNED_KEYS.get((target_type, name))
+        if key is None or key.target_type is not target_type:
+            key = cls(target_type, name)
+        return key
 
     def __str__(self) -> str:
         name_str = f" {self.name}" if self.name else ""
@@ -62,18 +121,51 @@ class InstanceKey(DIKey):
         return f"{type_name}{name_str}"
 
     def __hash__(self) -> int:
-        return hash((self.target_type, self.name))
+        return self._hash
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, InstanceKey)
+        return (
+            self._hash == other._hash
+            and self.target_type == other.target_type
+            and self.name == other.name
+        )
 
-@dataclass(frozen=True)
+
+_INTERNED_KEYS: weakref.WeakValueDictionary[tuple[type, str | None], InstanceKey] = (
+    weakref.WeakValueDictionary()
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SetElementKey(DIKey):
     """A key that identifies a specific element within a set binding."""
 
     set_key: InstanceKey
     element_key: InstanceKey
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.set_key, self.element_key)))
 
     def __str__(self) -> str:
         return f"{self.set_key}[{self.element_key}]"
 
     def __hash__(self) -> int:
-        return hash((self.set_key, self.element_key))
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, SetElementKey)
+        return (
+            self._hash == other._hash
+            and self.set_key == other.set_key
+            and self.element_key == other.element_key
+        )
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import inspect
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from .keys import InstanceKey, SetElementKey
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class ExecutableOp(ABC):
     """Base class for executable operations in the dependency injection system."""
 
+    __slots__ = ()
+
     @abstractmethod
     def key(self) -> InstanceKey:
         """Get the DIKey this operation produces."""
@@ -38,11 +40,14 @@ class ExecutableOp(ABC):
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Provide(ExecutableOp):
     """Operation that provides a single instance using a binding."""
 
     binding: Binding
+    _arg_keys: tuple[InstanceKey, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def key(self) -> InstanceKey:
         """Get the DIKey this operation produces."""
@@ -56,32 +61,38 @@ class Provide(ExecutableOp):
 
     def execute(self, resolved_deps: dict[InstanceKey, Any]) -> Any:  # noqa: ARG002
         """Execute the binding with resolved dependencies."""
-        dependencies = self.binding.functoid.sig()
-        resolved_args: list[Any] = []
-
-        for dep in dependencies:
-            # Skip Any types which are usually introspection failures
-            if dep.type_hint == Any:
-                continue
-            if (
-                (not dep.is_optional or dep.default_value == inspect.Parameter.empty)
-                and (isinstance(dep.type_hint, type) or hasattr(dep.type_hint, "__origin__"))
-                and not isinstance(dep.type_hint, str)
-            ):
-                # Handle both regular types and generic types (like set[T]), but skip string forward references
-                dep_key = InstanceKey(dep.type_hint, dep.dependency_name)
-                resolved_args.append(resolved_deps[dep_key])
-            # For optional dependencies with defaults, let the functoid handle them
+        resolved_args = [resolved_deps[dep_key] for dep_key in self._argument_keys()]
 
         # Call the functoid - it may return a coroutine if it's async
         return self.binding.functoid.call(*resolved_args)
 
+    def _argument_keys(self) -> tuple[InstanceKey, ...]:
+        """Get the keys of the positional call arguments, computed once per operation."""
+        arg_keys = self._arg_keys
+        if arg_keys is None:
+            keys: list[InstanceKey] = []
+            for dep in self.binding.functoid.sig():
+                # Skip Any types which are usually introspection failures
+                if dep.type_hint == Any:
+                    continue
+                if (
+                    (not dep.is_optional or dep.default_value == inspect.Parameter.empty)
+                    and (isinstance(dep.type_hint, type) or hasattr(dep.type_hint, "__origin__"))
+                    and not isinstance(dep.type_hint, str)
+                ):
+                    # Handle both regular types and generic types (like set[T]), but skip string forward references
+                    keys.append(InstanceKey(dep.type_hint, dep.dependency_name))
+                # For optional dependencies with defaults, let the functoid handle them
+            arg_keys = tuple(keys)
+            self._arg_keys = arg_keys
+        return arg_keys
+
     def is_async(self) -> bool:
         """Return whether this operation is async."""
         return self.binding.functoid.is_async()
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateFactory(ExecutableOp):
     """Operation that creates a Factory instance for assisted injection."""
 
@@ -117,7 +128,7 @@ class CreateFactory(ExecutableOp):
         return Factory(self.target_type, locator, self.binding.functoid)  # pyright: ignore[reportUnknownVariableType]
 
 
-@dataclass
+@dataclass(slots=True)
 class Lookup(ExecutableOp):
     """Operation that looks up an existing binding and exposes it with a new key."""
 
@@ -139,12 +150,13 @@ class Lookup(ExecutableOp):
         return resolved_deps[self.source_key]
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateSet(ExecutableOp):
     """Operation that creates a set by collecting all set element bindings."""
 
     set_key: InstanceKey
     element_keys: list[InstanceKey]
+    frozen_elements: frozenset[Any] = frozenset()  # Value elements known at planning time
 
     def key(self) -> InstanceKey:
         """Get the DIKey this operation produces."""
@@ -155,15 +167,15 @@ class CreateSet(ExecutableOp):
         return self.element_keys
 
     def execute(self, resolved_deps: dict[InstanceKey, Any]) -> Any:  # noqa: ARG002
-        """Execute by collecting all resolved set elements."""
-        elements: set[Any] = set()
+        """Execute by collecting the frozen and all resolved set elements."""
+        elements: set[Any] = set(self.frozen_elements)
         for element_key in self.element_keys:
             if element_key in resolved_deps:
                 elements.add(resolved_deps[element_key])
         return elements
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateSubcontext(ExecutableOp):
     """Operation that creates a Subcontext for dynamically resolved dependencies."""
 
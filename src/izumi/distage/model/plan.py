@@ -4,18 +4,23 @@ Plan - Represents a validated dependency graph with metadata that can be execute
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypeVar
 
 from ..activation import Activation
 from ..roots import Roots
 from .graph import DependencyGraph
 from .keys import InstanceKey
+from .operations import ExecutableOp
 
 T = TypeVar("T")
 
+# A precompiled execution step: the produced key, its operation and the operation's
+# dependencies paired with their slot in the plan (-1 for keys resolved outside the plan)
+CompiledStep = tuple[InstanceKey, ExecutableOp, tuple[tuple[InstanceKey, int], ...]]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Plan:
     """
     A validated dependency injection plan containing the graph and metadata.
@@ -32,6 +37,14 @@ class Plan:
     roots: Roots
     activation: Activation
     topology: list[InstanceKey]
+    _operations: dict[InstanceKey, ExecutableOp] = field(init=False, repr=False, compare=False)
+    _execution_order: tuple[InstanceKey, ...] = field(init=False, repr=False, compare=False)
+    _compiled: tuple[CompiledStep, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _slots: dict[InstanceKey, int] = field(
+        default_factory=dict[InstanceKey, int], init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Ensure the plan is validated."""
@@ -39,6 +52,9 @@ class Plan:
         # The validation should have been done before creating the Plan
         if not getattr(self.graph, "_validated", False):
             raise ValueError("Plan created with unvalidated graph")
+        # Snapshot the operations once, the graph is not modified after validation
+        object.__setattr__(self, "_operations", self.graph.get_operations())
+        object.__setattr__(self, "_execution_order", tuple(reversed(self.topology)))
 
     @staticmethod
     def empty() -> Plan:
@@ -68,22 +84,52 @@ class Plan:
         Returns:
             True if this plan has no operations
         """
-        return len(self.graph.get_operations()) == 0
+        return len(self._operations) == 0
 
     def keys(self) -> set[InstanceKey]:
         """Get all available keys in this plan."""
-        return set(self.graph.get_operations().keys())
+        return set(self._operations.keys())
 
     def has_operation(self, key: InstanceKey) -> bool:
         """Check if an operation exists for the given key."""
-        return key in self.graph.get_operations()
+        return key in self._operations
+
+    def get_operation(self, key: InstanceKey) -> ExecutableOp | None:
+        """Get the operation for the given key, if any."""
+        return self._operations.get(key)
 
     def has_binding(self, key: InstanceKey) -> bool:
         """Check if a binding exists for the given key."""
         return self.graph.get_binding(key) is not None
 
-    def get_execution_order(self) -> list[InstanceKey]:
-        """Get the topological order for execution."""
-        copy = self.topology.copy()
-        copy.reverse()
-        return copy
+    def get_execution_order(self) -> tuple[InstanceKey, ...]:
+        """Get the topological order for execution, computed once when the plan is created."""
+        return self._execution_order
+
+    def compiled(self) -> tuple[CompiledStep, ...]:
+        """
+        Get the execution steps of this plan, compiled on first use.
+
+        Each step pairs a key with its operation and the operation's dependencies
+        in execution order, so producing several Locators from the same Plan
+        does not walk the graph or recompute dependency keys again. The key of
+        step i is assigned slot i, see slots().
+        """
+        compiled = self._compiled
+        if compiled is None:
+            order = self.get_execution_order()
+            slots = {key: slot for slot, key in enumerate(order)}
+            steps: list[CompiledStep] = []
+            for key in order:
+                operation = self._operations[key]
+                dependencies = tuple((dep, slots.get(dep, -1)) for dep in operation.dependencies())
+                steps.append((key, operation, dependencies))
+            compiled = tuple(steps)
+            object.__setattr__(self, "_slots", slots)
+            object.__setattr__(self, "_compiled", compiled)
+        return compiled
+
+    def slots(self) -> dict[InstanceKey, int]:
+        """Get the slot assigned to each key of this plan, in execution order."""
+        self.compiled()
+        return self._slots
@@ -4,12 +4,19 @@ PlannerInput - Immutable structure containing all inputs needed for dependency i
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 from .activation import Activation
 from .dsl import ModuleDef
+from .locator_base import Locator
+from .model import Plan
 from .roots import Roots
 
+# How many parent locators a single PlannerInput remembers plans for
+_PLAN_CACHE_SIZE = 8
+
 
 @dataclass(frozen=True)
 class PlannerInput:
@@ -18,15 +25,26 @@ class PlannerInput:
 
     This matches the original distage library design where the Injector is stateless
     and takes PlannerInput as arguments to planning methods.
+
+    Inputs compare and hash by the identity of their modules, so they can be used
+    as cache keys; the modules themselves are mutable builders.
     """
 
     modules: tuple[ModuleDef, ...]
     roots: Roots
     activation: Activation
+    # (weak parent locator, module versions, plan) of the plans built from this input,
+    # keyed by the identity of the parent locator, least recently built first. Entries
+    # drop out when their parent locator is collected, so its instances are not kept alive
+    _plan_cache: dict[int, tuple[weakref.ref[Locator], tuple[int, ...], Plan]] = field(
+        default_factory=dict[int, tuple[weakref.ref[Locator], tuple[int, ...], Plan]],
+        repr=False,
+        compare=False,
+    )
 
     def __init__(
         self,
-        modules: tuple[ModuleDef, ...] | list[ModuleDef],
+        modules: ModuleDef | Iterable[ModuleDef],
         roots: Roots | None = None,
         activation: Activation | None = None,
     ):
@@ -34,17 +52,72 @@ class PlannerInput:
         Create a new PlannerInput.
 
         Args:
-            modules: The modules containing bindings
+            modules: A module or the modules containing bindings
             roots: The roots configuration (defaults to everything)
             activation: The activation configuration (defaults to empty)
         """
-        # Convert to tuple if list is provided
-        modules_tuple = tuple(modules) if isinstance(modules, list) else modules
+        # Always store an immutable tuple, whatever collection was provided
+        modules_tuple = (modules,) if isinstance(modules, ModuleDef) else tuple(modules)
 
         # Use object.__setattr__ since we're frozen
         object.__setattr__(self, "modules", modules_tuple)
         object.__setattr__(self, "roots", roots or Roots.everything())
         object.__setattr__(self, "activation", activation or Activation.empty())
+        object.__setattr__(self, "_plan_cache", {})
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, PlannerInput):
+            return NotImplemented
+        return (
+            len(self.modules) == len(other.modules)
+            and all(
+                mine is theirs for mine, theirs in zip(self.modules, other.modules, strict=True)
+            )
+            and self.roots == other.roots
+            and self.activation == other.activation
+        )
+
+    def __hash__(self) -> int:
+        # Activation holds a dict and is left out, equal inputs still hash equally
+        return hash((tuple(id(module) for module in self.modules), id(self.roots)))
+
+    def cached_plan(self, parent_locator: Locator) -> Plan | None:
+        """
+        Get the Plan previously built from this input.
+
+        The cached Plan is only returned when it was built against the same parent
+        locator and none of the modules has been modified since.
+        """
+        cache = self._plan_cache.get(id(parent_locator))
+        if cache is None or cache[0]() is not parent_locator:
+            return None
+        if cache[1] != tuple(module.version for module in self.modules):
+            return None
+        return cache[2]
+
+    def cache_plan(self, parent_locator: Locator, plan: Plan) -> None:
+        """
+        Remember the Plan built from this input against the given parent locator.
+
+        Plans for a few different parents are kept, so planning one input under
+        several parent locators in turn does not keep evicting the other plans.
+        """
+        versions = tuple(module.version for module in self.modules)
+        cache = self._plan_cache
+        key = id(parent_locator)
+
+        def forget(ref: weakref.ref[Locator]) -> None:
+            # The entry may already have been evicted or replaced
+            entry = cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del cache[key]
+
+        cache.pop(key, None)
+        if len(cache) >= _PLAN_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (weakref.ref(parent_locator, forget), versions, plan)
 
     def with_roots(self, roots: Roots) -> PlannerInput:
         """Create a new PlannerInput with different roots."""
@@ -60,9 +133,7 @@ class PlannerInput:
         return PlannerInput(new_modules, self.roots, self.activation)
 
     @staticmethod
-    def target(
-        modules: tuple[ModuleDef, ...] | list[ModuleDef], *target_types: type
-    ) -> PlannerInput:
+    def target(modules: ModuleDef | Iterable[ModuleDef], *target_types: type) -> PlannerInput:
         """
         Create a PlannerInput targeting specific types.
 
@@ -77,7 +148,7 @@ class PlannerInput:
         return PlannerInput(modules, roots)
 
     @staticmethod
-    def everything(modules: tuple[ModuleDef, ...] | list[ModuleDef]) -> PlannerInput:
+    def everything(modules: ModuleDef | Iterable[ModuleDef]) -> PlannerInput:
         """
         Create a PlannerInput that produces everything.
 
@@ -6,12 +6,35 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+# Canonical Tag instance per name
+_INTERNED_TAGS: dict[str, Tag] = {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False, slots=True)
 class Tag:
-    """A tag for distinguishing between different bindings of the same type."""
+    """
+    A tag for distinguishing between different bindings of the same type.
+
+    Tags are interned: creating a Tag with a name that was seen before returns the
+    existing instance, so tags compare and hash by identity.
+    """
 
     name: str
 
+    def __new__(cls, name: str) -> Tag:
+        tag = _INTERNED_TAGS.get(name)
+        if tag is None:
+            tag = object.__new__(cls)
+            _INTERNED_TAGS[name] = tag
+        return tag
+
+    def __reduce__(self) -> tuple[type[Tag], tuple[str]]:
+        return Tag, (self.name,)
+
+    @classmethod
+    def of(cls, name: str) -> Tag:
+        """Get the canonical Tag for the given name."""
+        return cls(name)
+
     def __str__(self) -> str:
         return f"@{self.name}"
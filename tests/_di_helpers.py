@@ -0,0 +1,40 @@
+"""
+Shared helpers for tests that plan the same modules repeatedly.
+"""
+
+import functools
+from collections.abc import Callable
+
+from izumi.distage import Injector, Locator, ModuleDef, Plan, PlannerInput
+
+# Upper bound on the modules remembered by plan_cached; the oldest entry is dropped first
+_PLANNER_INPUTS_SIZE = 64
+
+# One PlannerInput per module, keyed by module identity, least recently added first.
+# ModuleDef is unhashable, so each entry holds its module and lookups check it is the
+# very same object. The input's own plan cache takes care of invalidation when the
+# module changes or it is planned against another parent locator.
+_PLANNER_INPUTS: dict[int, tuple[ModuleDef, PlannerInput]] = {}
+
+
+def plan_cached(injector: Injector, module: ModuleDef) -> Plan:
+    """Plan a single module, reusing the Plan built earlier for the same module and parent."""
+    entry = _PLANNER_INPUTS.get(id(module))
+    if entry is None or entry[0] is not module:
+        if len(_PLANNER_INPUTS) >= _PLANNER_INPUTS_SIZE:
+            del _PLANNER_INPUTS[next(iter(_PLANNER_INPUTS))]
+        entry = (module, PlannerInput([module]))
+        _PLANNER_INPUTS[id(module)] = entry
+    return injector.plan(entry[1])
+
+
+@functools.cache
+def parent_locator_for(module_factory: Callable[[], ModuleDef]) -> Locator:
+    """
+    Produce a root locator from the module built by module_factory, once per factory.
+
+    The factory must be a module-level function: the locator is shared by every test
+    that asks for it, so tests must not depend on its instances being fresh.
+    """
+    injector = Injector()
+    return injector.produce(plan_cached(injector, module_factory()))
@@ -3,10 +3,12 @@
 Unit tests for Chibi Izumi library.
 """
 
+import copy
+import pickle
 import unittest
 from dataclasses import dataclass
 
-from izumi.distage import Injector, ModuleDef, PlannerInput
+from izumi.distage import Injector, ModuleDef, PlannerInput, Tag
 from izumi.distage.introspection import SignatureIntrospector
 from izumi.distage.model import DIKey
 from izumi.distage.model.graph import CircularDependencyError, MissingBindingError
@@ -133,6 +135,20 @@ class TestTaggedBindings(unittest.TestCase):
         self.assertEqual(prod_db, "production-db")
         self.assertEqual(test_db, "test-db")
 
+    def test_tags_are_interned(self):
+        """Test that tags with the same name are the same instance."""
+        self.assertIs(Tag("prod"), Tag("prod"))
+        self.assertIs(Tag.of("prod"), Tag("prod"))
+        self.assertNotEqual(Tag("prod"), Tag("test"))
+        self.assertEqual(len({Tag("prod"), Tag("prod"), Tag("test")}), 2)
+
+    def test_tags_survive_pickle_and_copy_as_interned(self):
+        """Test that pickling and copying a tag yields the interned instance."""
+        tag = Tag("prod")
+        self.assertIs(pickle.loads(pickle.dumps(tag)), tag)
+        self.assertIs(copy.copy(tag), tag)
+        self.assertIs(copy.deepcopy(tag), tag)
+
 
 class TestSetBindings(unittest.TestCase):
     """Test set bindings."""
@@ -169,6 +185,11 @@ class TestSetBindings(unittest.TestCase):
         self.assertIn(handler1, service.handlers)
         self.assertIn(handler2, service.handlers)
 
+        # Value elements are frozen at planning time, but each locator gets its own set
+        other = injector.produce(injector.plan(planner_input)).get(DIKey.of(Service))
+        self.assertEqual(other.handlers, service.handlers)
+        self.assertIsNot(other.handlers, service.handlers)
+
     def test_multiple_many_calls_add_all_elements(self):
         """Test that calling module.many() multiple times adds all elements to the set."""
 
@@ -229,6 +250,25 @@ class TestSignatureIntrospection(unittest.TestCase):
         self.assertEqual(deps[1].name, "config")
         self.assertEqual(deps[1].type_hint, int)
 
+        # Repeated extraction reuses the cached dependencies but returns a fresh list
+        again = SignatureIntrospector.extract_from_class(Service)
+        self.assertIsNot(again, deps)
+        self.assertIs(again[0], deps[0])
+
+    def test_class_dependencies_with_unresolved_hints_are_not_cached(self):
+        """Test that a constructor whose type hints cannot be resolved yet is extracted again."""
+
+        class Service:
+            def __init__(self, database: "_LateDatabase"):  # noqa: F821
+                pass
+
+        deps = SignatureIntrospector.extract_from_class(Service)
+        self.assertEqual(deps[0].type_hint, "_LateDatabase")
+
+        # The forward reference may become resolvable later, so nothing was cached
+        again = SignatureIntrospector.extract_from_class(Service)
+        self.assertIsNot(again[0], deps[0])
+
     def test_extract_function_dependencies(self):
         """Test extracting dependencies from a function."""
 
@@ -243,6 +283,28 @@ class TestSignatureIntrospection(unittest.TestCase):
         self.assertEqual(deps[1].name, "port")
         self.assertEqual(deps[1].type_hint, int)
 
+        # Repeated extraction reuses the cached dependencies but returns a fresh list
+        again = SignatureIntrospector.extract_from_callable(factory)
+        self.assertIsNot(again, deps)
+        self.assertIs(again[0], deps[0])
+
+    def test_takes_no_arguments(self):
+        """Test detecting parameterless functions without introspection."""
+
+        def no_deps() -> str:
+            return "ok"
+
+        def with_dep(db: str) -> str:
+            return db
+
+        def with_varargs(*args: str) -> str:
+            return "".join(args)
+
+        self.assertTrue(SignatureIntrospector.takes_no_arguments(no_deps))
+        self.assertFalse(SignatureIntrospector.takes_no_arguments(with_dep))
+        self.assertFalse(SignatureIntrospector.takes_no_arguments(with_varargs))
+        self.assertFalse(SignatureIntrospector.takes_no_arguments(str))
+
     def test_dataclass_dependencies(self):
         """Test extracting dependencies from a dataclass."""
 
@@ -4,9 +4,11 @@ Unit tests for the new algebraic implementation structure.
 """
 
 import unittest
+from typing import Optional
 
 from izumi.distage import Injector, ModuleDef, PlannerInput
 from izumi.distage.functoid import (
+    Functoid,
     class_functoid,
     function_functoid,
     set_element_functoid,
@@ -93,6 +95,47 @@ class TestAlgebraicImplementations(unittest.TestCase):
         self.assertEqual(set_functoid.keys(), [])
         self.assertEqual(set_functoid.call(), "func-result")
 
+    def test_functoid_keys_computed_once(self):
+        """Test that functoid dependency keys are computed once."""
+        calls: list[int] = []
+
+        def keys_fn() -> list[InstanceKey]:
+            calls.append(1)
+            return [InstanceKey(str, None)]
+
+        functoid = Functoid(keys_fn=keys_fn, sig_fn=lambda: [], call_fn=lambda s: s)
+
+        keys = functoid.keys()
+        keys.append(InstanceKey(int, None))
+
+        self.assertEqual(functoid.keys(), [InstanceKey(str, None)])
+        self.assertEqual(len(calls), 1)
+
+
+class TestInstanceKey(unittest.TestCase):
+    """Test InstanceKey interning."""
+
+    def test_equal_keys_are_interned(self):
+        """Test that equal keys share one instance."""
+        key = InstanceKey(str, "element-0")
+
+        self.assertIs(InstanceKey(str, "element-0"), key)
+        self.assertIs(DIKey.of(str, "element-0"), key)
+        self.assertIsNot(InstanceKey(str, "element-1"), key)
+        self.assertEqual(key.target_type, str)
+        self.assertEqual(key.name, "element-0")
+
+    def test_equal_but_distinct_types_keep_their_own_type(self):
+        """Test that a key keeps the type object it was created with."""
+        optional_key = InstanceKey(Optional[int], None)  # noqa: UP045
+        union_type = int | None
+
+        union_key = InstanceKey(union_type, None)
+        self.assertIs(union_key.target_type, union_type)
+        self.assertIs(DIKey.of(union_type).target_type, union_type)
+        self.assertEqual(union_key, optional_key)
+        self.assertIs(optional_key.target_type, Optional[int])  # noqa: UP045
+
 
 class TestSetElementKey(unittest.TestCase):
     """Test SetElementKey functionality."""
@@ -372,6 +415,9 @@ class TestSetElementKeyIntegration(unittest.TestCase):
         self.assertEqual(binding.key.element_key.target_type, str)
         self.assertTrue(binding.key.element_key.name.startswith("set-element-"))
 
+        # Set element bindings can be looked up by their element key
+        self.assertIs(plan.graph.get_binding(binding.key.element_key), binding)
+
     def test_set_element_dependency_resolution(self):
         """Test that set elements with dependencies resolve correctly."""
 
@@ -3,7 +3,9 @@
 Unit tests for the new architecture with Injector, Plan, and Locator separation.
 """
 
+import gc
 import unittest
+import weakref
 from dataclasses import dataclass
 
 from izumi.distage import Injector, ModuleDef, Plan, PlannerInput
@@ -84,6 +86,10 @@ class TestLocator(unittest.TestCase):
         self.assertNotEqual(counter1.id, counter2.id)
         self.assertIsNot(counter1, counter2)
 
+        # The plan is compiled once and the steps are reused by every produce
+        self.assertIs(plan.compiled(), plan.compiled())
+        self.assertEqual([key for key, _, _ in plan.compiled()], list(plan.get_execution_order()))
+
     def test_plan_reuse_with_same_locator(self):
         """Test that same locator reuses instances."""
 
@@ -106,6 +112,75 @@ class TestLocator(unittest.TestCase):
         self.assertIs(service1, service2)
         self.assertEqual(service1.created_at, service2.created_at)
 
+    def test_plan_cached_on_planner_input(self):
+        """Test that planning the same PlannerInput twice reuses the Plan until a module changes."""
+
+        class Service:
+            pass
+
+        class Other:
+            pass
+
+        module = ModuleDef()
+        module.make(Service).using().type(Service)
+
+        injector = Injector()
+        planner_input = PlannerInput([module])
+        plan = injector.plan(planner_input)
+
+        self.assertIs(injector.plan(planner_input), plan)
+        self.assertIs(Injector().plan(planner_input), plan)
+
+        # A child injector plans against a different parent
+        child_injector = Injector.inherit(injector.produce(plan))
+        child_plan = child_injector.plan(planner_input)
+        self.assertIsNot(child_plan, plan)
+
+        # Plans for both parents stay cached
+        self.assertIs(injector.plan(planner_input), plan)
+        self.assertIs(child_injector.plan(planner_input), child_plan)
+
+        # Modifying a module invalidates the cached plan
+        module.make(Other).using().type(Other)
+        replanned = injector.plan(planner_input)
+        self.assertIsNot(replanned, plan)
+        self.assertTrue(replanned.has_operation(DIKey.of(Other)))
+
+    def test_plan_cache_does_not_keep_parent_locators_alive(self):
+        """Test that a PlannerInput drops cached plans once their parent locator is collected."""
+
+        class Service:
+            pass
+
+        module = ModuleDef()
+        module.make(Service).using().type(Service)
+        planner_input = PlannerInput([module])
+
+        parent = Injector().produce(Injector().plan(PlannerInput([ModuleDef()])))
+        parent_ref = weakref.ref(parent)
+        Injector.inherit(parent).plan(planner_input)
+        self.assertIsNotNone(planner_input.cached_plan(parent))
+
+        del parent
+        gc.collect()
+        self.assertIsNone(parent_ref())
+        self.assertEqual(len(planner_input._plan_cache), 0)
+
+    def test_planner_input_modules(self):
+        """Test that PlannerInput stores modules as a tuple and compares by module identity."""
+        module = ModuleDef()
+        module.make(str).using().value("test")
+
+        single = PlannerInput(module)
+        from_list = PlannerInput([module])
+        from_generator = PlannerInput(m for m in [module])
+
+        self.assertEqual(single.modules, (module,))
+        self.assertEqual(from_generator.modules, (module,))
+        self.assertEqual(from_list, PlannerInput((module,), from_list.roots))
+        self.assertEqual(hash(from_list), hash(PlannerInput((module,), from_list.roots)))
+        self.assertNotEqual(from_list, PlannerInput([ModuleDef()], from_list.roots))
+
     def test_locator_utilities(self):
         """Test Locator utility methods."""
 
@@ -145,6 +220,11 @@ class TestLocator(unittest.TestCase):
         missing_service = locator.find(DIKey.of(MissingService))
         self.assertIsNone(missing_service)
 
+        # Test get_many() method
+        self.assertEqual(locator.get_many([DIKey.of(ExistingService)]), [service])
+        with self.assertRaises(ValueError):
+            locator.get_many([DIKey.of(ExistingService), DIKey.of(MissingService)])
+
     def test_backward_compatibility(self):
         """Test that existing Injector.get() method still works."""
 
@@ -261,9 +341,15 @@ class TestLocator(unittest.TestCase):
 
         # Test get_execution_order() method
         execution_order = plan.get_execution_order()
-        self.assertIsInstance(execution_order, list)
+        self.assertIsInstance(execution_order, tuple)
+        self.assertIs(plan.get_execution_order(), execution_order)
         self.assertGreater(len(execution_order), 0)
 
+        # Plans, keys and locators are slotted and carry no per-instance dict
+        locator = injector.produce(plan)
+        for obj in (plan, service_a_key, locator):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
     def test_tagged_bindings_with_new_architecture(self):
         """Test named bindings work with the new architecture."""
 
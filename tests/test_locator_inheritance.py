@@ -3,34 +3,91 @@
 Unit tests for locator inheritance functionality.
 """
 
+import itertools
 import unittest
-from dataclasses import dataclass
 
-from izumi.distage import Injector, ModuleDef, PlannerInput
+from izumi.distage import Injector, ModuleDef
 from izumi.distage.model import DIKey
 from izumi.distage.model.graph import MissingBindingError
+from tests._di_helpers import parent_locator_for, plan_cached
+
+_SHARED_INJECTOR = Injector()
+_SHARED_EMPTY_MODULE = ModuleDef()
+
+
+class Service:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class SingletonService:
+    __slots__ = ("instance_id",)
+    _counter = itertools.count(1)
+
+    def __init__(self):
+        self.instance_id = next(SingletonService._counter)
+
+
+class ClientService:
+    __slots__ = ("singleton",)
+
+    def __init__(self, singleton: SingletonService):
+        self.singleton = singleton
+
+
+class Database:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+def _service_parent_module() -> ModuleDef:
+    module = ModuleDef()
+    module.make(Service).using().value(Service("parent"))
+    return module
+
+
+def _named_database_parent_module() -> ModuleDef:
+    module = ModuleDef()
+    module.make(Database).named("primary").using().value(Database("primary"))
+    module.make(Database).named("cache").using().value(Database("cache"))
+    return module
 
 
 class TestLocatorInheritance(unittest.TestCase):
     """Test locator inheritance functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Parent locator shared by the tests that only need a Service("parent") binding
+        cls.parent_locator = parent_locator_for(_service_parent_module)
+
     def test_basic_inheritance(self):
         """Test basic parent-child locator inheritance."""
 
-        @dataclass
         class Config:
-            value: str
+            __slots__ = ("value",)
+
+            def __init__(self, value: str):
+                self.value = value
 
-        @dataclass
         class DatabaseService:
-            config: Config
+            __slots__ = ("config",)
+
+            def __init__(self, config: Config):
+                self.config = config
 
             def get_data(self) -> str:
                 return f"data-{self.config.value}"
 
-        @dataclass
         class ApiService:
-            db: DatabaseService
+            __slots__ = ("db",)
+
+            def __init__(self, db: DatabaseService):
+                self.db = db
 
             def get_response(self) -> str:
                 return f"api-{self.db.get_data()}"
@@ -40,10 +97,7 @@ class TestLocatorInheritance(unittest.TestCase):
         parent_module.make(Config).using().value(Config("production"))
         parent_module.make(DatabaseService).using().type(DatabaseService)
 
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        parent_locator = _SHARED_INJECTOR.produce(plan_cached(_SHARED_INJECTOR, parent_module))
 
         # Create child module that only has ApiService
         child_module = ModuleDef()
@@ -51,9 +105,7 @@ class TestLocatorInheritance(unittest.TestCase):
 
         # Create child injector that inherits from parent
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([child_module])
-        child_plan = child_injector.plan(child_input)
-        child_locator = child_injector.produce(child_plan)
+        child_locator = child_injector.produce(plan_cached(child_injector, child_module))
 
         # Verify that child can access both its own and parent's dependencies
         api_service = child_locator.get(DIKey.of(ApiService))
@@ -72,27 +124,15 @@ class TestLocatorInheritance(unittest.TestCase):
     def test_child_overrides_parent(self):
         """Test that child bindings override parent bindings."""
 
-        @dataclass
-        class Service:
-            name: str
-
-        # Parent module with one implementation
-        parent_module = ModuleDef()
-        parent_module.make(Service).using().value(Service("parent"))
-
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        # Parent binds Service("parent")
+        parent_locator = self.parent_locator
 
         # Child module with different implementation
         child_module = ModuleDef()
         child_module.make(Service).using().value(Service("child"))
 
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([child_module])
-        child_plan = child_injector.plan(child_input)
-        child_locator = child_injector.produce(child_plan)
+        child_locator = child_injector.produce(plan_cached(child_injector, child_module))
 
         # Child should use its own binding, not parent's
         service = child_locator.get(DIKey.of(Service))
@@ -105,63 +145,39 @@ class TestLocatorInheritance(unittest.TestCase):
     def test_named_bindings_inheritance(self):
         """Test inheritance with named bindings."""
 
-        @dataclass
-        class Database:
-            name: str
-
-        @dataclass
-        class Service:
-            primary_db: Database
-            cache_db: Database
+        class DatabaseClient:
+            __slots__ = ("primary_db", "cache_db")
 
-        # Parent module with named bindings
-        parent_module = ModuleDef()
-        parent_module.make(Database).named("primary").using().value(Database("primary"))
-        parent_module.make(Database).named("cache").using().value(Database("cache"))
+            def __init__(self, primary_db: Database, cache_db: Database):
+                self.primary_db = primary_db
+                self.cache_db = cache_db
 
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        # Parent with named bindings
+        parent_locator = parent_locator_for(_named_database_parent_module)
 
         # Child module that depends on parent's named bindings
         child_module = ModuleDef()
 
-        def create_service(primary_db: Database, cache_db: Database) -> Service:
-            return Service(primary_db, cache_db)
+        def create_client(primary_db: Database, cache_db: Database) -> DatabaseClient:
+            return DatabaseClient(primary_db, cache_db)
 
-        child_module.make(Service).using().func(create_service)
+        child_module.make(DatabaseClient).using().func(create_client)
 
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([child_module])
 
         # This should fail because the child doesn't know about the named dependencies
         # during planning phase (automatic dependency resolution during signature introspection)
         with self.assertRaises(MissingBindingError):
-            child_injector.plan(child_input)
+            plan_cached(child_injector, child_module)
 
     def test_manual_named_dependency_resolution(self):
         """Test manual resolution of named dependencies from parent."""
-
-        @dataclass
-        class Database:
-            name: str
-
-        # Parent module with named bindings
-        parent_module = ModuleDef()
-        parent_module.make(Database).named("primary").using().value(Database("primary"))
-        parent_module.make(Database).named("cache").using().value(Database("cache"))
-
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        # Parent with named bindings
+        parent_locator = parent_locator_for(_named_database_parent_module)
 
         # Child can manually access named dependencies from parent
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([ModuleDef()])  # Empty module
-        child_plan = child_injector.plan(child_input)
-        child_locator = child_injector.produce(child_plan)
+        child_locator = child_injector.produce(plan_cached(child_injector, _SHARED_EMPTY_MODULE))
 
         # Access named dependencies directly
         primary_db = child_locator.get(DIKey.of(Database, "primary"))
@@ -173,47 +189,46 @@ class TestLocatorInheritance(unittest.TestCase):
     def test_multi_level_inheritance(self):
         """Test inheritance across multiple levels."""
 
-        @dataclass
         class Level1Service:
-            name: str = "level1"
+            __slots__ = ("name",)
+
+            def __init__(self, name: str = "level1"):
+                self.name = name
 
-        @dataclass
         class Level2Service:
-            level1: Level1Service
-            name: str = "level2"
+            __slots__ = ("level1", "name")
+
+            def __init__(self, level1: Level1Service, name: str = "level2"):
+                self.level1 = level1
+                self.name = name
 
-        @dataclass
         class Level3Service:
-            level1: Level1Service
-            level2: Level2Service
-            name: str = "level3"
+            __slots__ = ("level1", "level2", "name")
+
+            def __init__(self, level1: Level1Service, level2: Level2Service, name: str = "level3"):
+                self.level1 = level1
+                self.level2 = level2
+                self.name = name
 
         # Level 1 injector
         level1_module = ModuleDef()
         level1_module.make(Level1Service).using().type(Level1Service)
 
-        level1_injector = Injector()
-        level1_input = PlannerInput([level1_module])
-        level1_plan = level1_injector.plan(level1_input)
-        level1_locator = level1_injector.produce(level1_plan)
+        level1_locator = _SHARED_INJECTOR.produce(plan_cached(_SHARED_INJECTOR, level1_module))
 
         # Level 2 injector inherits from level 1
         level2_module = ModuleDef()
         level2_module.make(Level2Service).using().type(Level2Service)
 
         level2_injector = Injector.inherit(level1_locator)
-        level2_input = PlannerInput([level2_module])
-        level2_plan = level2_injector.plan(level2_input)
-        level2_locator = level2_injector.produce(level2_plan)
+        level2_locator = level2_injector.produce(plan_cached(level2_injector, level2_module))
 
         # Level 3 injector inherits from level 2
         level3_module = ModuleDef()
         level3_module.make(Level3Service).using().type(Level3Service)
 
         level3_injector = Injector.inherit(level2_locator)
-        level3_input = PlannerInput([level3_module])
-        level3_plan = level3_injector.plan(level3_input)
-        level3_locator = level3_injector.produce(level3_plan)
+        level3_locator = level3_injector.produce(plan_cached(level3_injector, level3_module))
 
         # Level 3 should be able to access all services
         level3_service = level3_locator.get(DIKey.of(Level3Service))
@@ -222,28 +237,19 @@ class TestLocatorInheritance(unittest.TestCase):
         self.assertEqual(level3_service.level1.name, "level1")
         self.assertEqual(level3_service.level2.name, "level2")
 
+        # Keys held by an ancestor resolve to that ancestor's instance, also on repeated lookups
+        level1_service = level1_locator.get(DIKey.of(Level1Service))
+        self.assertIs(level3_locator.get(DIKey.of(Level1Service)), level1_service)
+        self.assertIs(level3_locator.get(DIKey.of(Level1Service)), level1_service)
+
     def test_locator_parent_properties(self):
         """Test locator parent access properties."""
 
-        @dataclass
-        class Service:
-            name: str
-
-        # Create parent locator
-        parent_module = ModuleDef()
-        parent_module.make(Service).using().value(Service("parent"))
-
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        parent_locator = self.parent_locator
 
         # Create child locator
-        child_module = ModuleDef()
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([child_module])
-        child_plan = child_injector.plan(child_input)
-        child_locator = child_injector.produce(child_plan)
+        child_locator = child_injector.produce(plan_cached(child_injector, _SHARED_EMPTY_MODULE))
 
         # Test parent properties
         self.assertFalse(parent_locator.has_parent())
@@ -255,28 +261,14 @@ class TestLocatorInheritance(unittest.TestCase):
     def test_instance_caching_across_inheritance(self):
         """Test that instances are properly cached when inherited."""
 
-        class SingletonService:
-            _instance_count = 0
-
-            def __init__(self):
-                SingletonService._instance_count += 1
-                self.instance_id = SingletonService._instance_count
-
-        @dataclass
-        class ClientService:
-            singleton: SingletonService
-
         # Reset counter
-        SingletonService._instance_count = 0
+        SingletonService._counter = itertools.count(1)
 
         # Create parent with singleton
         parent_module = ModuleDef()
         parent_module.make(SingletonService).using().type(SingletonService)
 
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        parent_locator = _SHARED_INJECTOR.produce(plan_cached(_SHARED_INJECTOR, parent_module))
 
         # Get singleton from parent
         parent_singleton = parent_locator.get(DIKey.of(SingletonService))
@@ -287,9 +279,7 @@ class TestLocatorInheritance(unittest.TestCase):
         child_module.make(ClientService).using().type(ClientService)
 
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([child_module])
-        child_plan = child_injector.plan(child_input)
-        child_locator = child_injector.produce(child_plan)
+        child_locator = child_injector.produce(plan_cached(child_injector, child_module))
 
         # Get client service which depends on singleton
         client_service = child_locator.get(DIKey.of(ClientService))
@@ -299,41 +289,37 @@ class TestLocatorInheritance(unittest.TestCase):
         child_singleton = child_locator.get(DIKey.of(SingletonService))
         self.assertEqual(child_singleton.instance_id, 1)
 
-        # All should be the same instance
+        # All should be the same instance, the only one created
         self.assertIs(parent_singleton, client_service.singleton)
         self.assertIs(parent_singleton, child_singleton)
 
-        # Should only have created one instance
-        self.assertEqual(SingletonService._instance_count, 1)
-
     def test_error_when_dependency_missing_in_both(self):
         """Test that proper error is raised when dependency is missing in both parent and child."""
 
-        @dataclass
         class MissingService:
-            name: str
+            __slots__ = ("name",)
+
+            def __init__(self, name: str):
+                self.name = name
 
-        @dataclass
         class ClientService:
-            missing: MissingService
+            __slots__ = ("missing",)
+
+            def __init__(self, missing: MissingService):
+                self.missing = missing
 
         # Create parent without MissingService
-        parent_module = ModuleDef()
-        parent_injector = Injector()
-        parent_input = PlannerInput([parent_module])
-        parent_plan = parent_injector.plan(parent_input)
-        parent_locator = parent_injector.produce(parent_plan)
+        parent_locator = parent_locator_for(ModuleDef)
 
         # Create child without MissingService
         child_module = ModuleDef()
         child_module.make(ClientService).using().type(ClientService)
 
         child_injector = Injector.inherit(parent_locator)
-        child_input = PlannerInput([child_module])
 
         # Should fail during planning because MissingService is not bound anywhere
         with self.assertRaises(MissingBindingError) as cm:
-            child_injector.plan(child_input)
+            plan_cached(child_injector, child_module)
 
         self.assertIn("MissingService", str(cm.exception))
 
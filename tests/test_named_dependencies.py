@@ -3,18 +3,187 @@
 Unit tests for named dependency injection using Id annotations.
 """
 
+import copy
 import logging
+import pickle
 import unittest
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Annotated
+from operator import attrgetter
+from typing import Annotated, Any, get_args
 
-from izumi.distage import Id, Injector, ModuleDef, PlannerInput
+from izumi.distage import Id, Injector, Locator, ModuleDef, PlannerInput
 from izumi.distage.model import DIKey
+from tests._di_helpers import plan_cached
+
+# Named dependency annotations shared across tests
+DB_HOST = Annotated[str, Id("db-host")]
+DB_PORT = Annotated[int, Id("db-port")]
+DB_URL = Annotated[str, Id("db-url")]
+API_KEY = Annotated[str, Id("api-key")]
+
+
+def _db_module() -> ModuleDef:
+    """Build a module binding the database host and port shared by several tests."""
+    module = ModuleDef()
+    module.bind_value(str, "localhost", name="db-host")
+    module.bind_value(int, 5432, name="db-port")
+    return module
+
+
+class DatabaseService:
+    def __init__(self, host: DB_HOST, port: DB_PORT):
+        self.host = host
+        self.port = port
+
+
+@dataclass
+class ServerConfig:
+    host: Annotated[str, Id("server-host")]
+    port: Annotated[int, Id("server-port")]
+    debug: bool = False
+
+
+class NamedLogger:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class ApiClient:
+    def __init__(
+        self,
+        logger: NamedLogger,
+        api_key: API_KEY,
+        timeout: Annotated[int, Id("timeout")],
+    ):
+        self.logger = logger
+        self.api_key = api_key
+        self.timeout = timeout
+
+
+def create_connection_string(
+    host: DB_HOST,
+    port: DB_PORT,
+    database: Annotated[str, Id("db-name")],
+) -> str:
+    return f"postgresql://{host}:{port}/{database}"
+
+
+def create_log_format(
+    prefix: Annotated[str, Id("prefix")], level: Annotated[str, Id("level")]
+) -> str:
+    return f"[{prefix}:{level}]"
+
+
+def worker_function(
+    worker_id: Annotated[str, Id("worker-id")], batch_size: Annotated[int, Id("batch-size")]
+) -> str:
+    return f"Worker {worker_id} processing {batch_size} items"
+
+
+def _constructor_module() -> ModuleDef:
+    module = _db_module()
+    module.bind_type(DatabaseService, DatabaseService)
+    return module
+
+
+def _function_module() -> ModuleDef:
+    module = _db_module()
+    module.bind_value(str, "myapp", name="db-name")
+    module.bind_func(str, create_connection_string, name="connection")
+    return module
+
+
+def _dataclass_module() -> ModuleDef:
+    module = ModuleDef()
+    module.bind_value(str, "0.0.0.0", name="server-host")
+    module.bind_value(int, 8080, name="server-port")
+    module.bind_type(ServerConfig, ServerConfig)
+    return module
+
+
+def _mixed_module() -> ModuleDef:
+    module = ModuleDef()
+    module.bind_value(NamedLogger, NamedLogger("default-logger"))
+    module.bind_value(str, "secret-key-123", name="api-key")
+    module.bind_value(int, 30, name="timeout")
+    module.bind_type(ApiClient, ApiClient)
+    return module
+
+
+def _log_format_module() -> ModuleDef:
+    module = ModuleDef()
+    module.bind_value(str, "LOG", name="prefix")
+    module.bind_value(str, "INFO", name="level")
+    module.bind_func(str, create_log_format, name="log-format")
+    return module
+
+
+def _worker_module() -> ModuleDef:
+    module = ModuleDef()
+    module.bind_value(str, "worker-001", name="worker-id")
+    module.bind_value(int, 100, name="batch-size")
+    return module
+
+
+# Scenarios that bind named values, build one component and read the injected values back:
+# (case name, module, read from the produced locator, expected result). Each module is built
+# once here, so plan_cached keeps a single entry per case and hits it on every run.
+_NAMED_INJECTION_CASES: list[tuple[str, ModuleDef, Callable[[Locator], Any], Any]] = [
+    (
+        "constructor",
+        _constructor_module(),
+        lambda locator: attrgetter("host", "port")(locator.get(DIKey.of(DatabaseService))),
+        ("localhost", 5432),
+    ),
+    (
+        "function",
+        _function_module(),
+        lambda locator: locator.get(DIKey.of(str, "connection")),
+        "postgresql://localhost:5432/myapp",
+    ),
+    (
+        "dataclass",
+        _dataclass_module(),
+        # debug keeps its default value
+        lambda locator: attrgetter("host", "port", "debug")(locator.get(DIKey.of(ServerConfig))),
+        ("0.0.0.0", 8080, False),
+    ),
+    (
+        "mixed named and unnamed",
+        _mixed_module(),
+        lambda locator: attrgetter("logger.name", "api_key", "timeout")(
+            locator.get(DIKey.of(ApiClient))
+        ),
+        ("default-logger", "secret-key-123", 30),
+    ),
+    (
+        "factory function",
+        _log_format_module(),
+        lambda locator: locator.get(DIKey.of(str, "log-format")),
+        "[LOG:INFO]",
+    ),
+    (
+        "locator run",
+        _worker_module(),
+        lambda locator: locator.run(worker_function),
+        "Worker worker-001 processing 100 items",
+    ),
+]
 
 
 class TestNamedDependencies(unittest.TestCase):
     """Test named dependency injection functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Injectors without a parent locator hold no state, so one instance serves every test
+        cls.injector = Injector()
+
+    def _produce(self, module: ModuleDef) -> Locator:
+        """Produce a locator for the module, planning each module only once."""
+        return self.injector.produce(plan_cached(self.injector, module))
+
     def test_id_annotation_basic(self):
         """Test basic Id annotation creation."""
         id_annotation = Id("test-id")
@@ -28,10 +197,23 @@ class TestNamedDependencies(unittest.TestCase):
         id3 = Id("different")
 
         self.assertEqual(id1, id2)
+        self.assertIs(id1, id2)
         self.assertNotEqual(id1, id3)
         self.assertEqual(hash(id1), hash(id2))
         self.assertNotEqual(hash(id1), hash(id3))
 
+    def test_id_annotation_survives_pickle_and_copy_as_interned(self):
+        """Test that pickling and copying an Id, bare or inside Annotated, keeps it interned."""
+        id_annotation = Id("db-host")
+        self.assertIs(pickle.loads(pickle.dumps(id_annotation)), id_annotation)
+        self.assertIs(copy.copy(id_annotation), id_annotation)
+        self.assertIs(copy.deepcopy(id_annotation), id_annotation)
+
+        restored = pickle.loads(pickle.dumps(DB_HOST))
+        self.assertEqual(restored, DB_HOST)
+        self.assertIs(get_args(restored)[1], id_annotation)
+        self.assertIs(get_args(copy.deepcopy(DB_HOST))[1], id_annotation)
+
     def test_signature_introspector_preserves_annotated_metadata(self):
         """
         Test that SignatureIntrospector correctly preserves Annotated metadata.
@@ -68,157 +250,65 @@ class TestNamedDependencies(unittest.TestCase):
         module.make(str).named("primary").using().value("primary-string")
         module.make(str).named("secondary").using().value("secondary-string")
 
-        injector = Injector()
-        planner_input = PlannerInput([module])
-
-        primary = injector.produce(injector.plan(planner_input)).get(DIKey.of(str, "primary"))
-        secondary = injector.produce(injector.plan(planner_input)).get(DIKey.of(str, "secondary"))
+        primary, secondary = self._produce(module).get_many(
+            [DIKey.of(str, "primary"), DIKey.of(str, "secondary")]
+        )
 
         self.assertEqual(primary, "primary-string")
         self.assertEqual(secondary, "secondary-string")
 
-    def test_annotated_constructor_injection(self):
-        """Test constructor injection with Annotated types."""
-
-        class DatabaseService:
-            def __init__(
-                self, host: Annotated[str, Id("db-host")], port: Annotated[int, Id("db-port")]
-            ):
-                self.host = host
-                self.port = port
-
-        module = ModuleDef()
-        module.make(str).named("db-host").using().value("localhost")
-        module.make(int).named("db-port").using().value(5432)
-        module.make(DatabaseService).using().type(DatabaseService)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        service = injector.produce(injector.plan(planner_input)).get(DIKey.of(DatabaseService))
-
-        self.assertEqual(service.host, "localhost")
-        self.assertEqual(service.port, 5432)
-
-    def test_annotated_function_injection(self):
-        """Test function injection with Annotated types."""
-
-        def create_connection_string(
-            host: Annotated[str, Id("db-host")],
-            port: Annotated[int, Id("db-port")],
-            database: Annotated[str, Id("db-name")],
-        ) -> str:
-            return f"postgresql://{host}:{port}/{database}"
-
-        module = ModuleDef()
-        module.make(str).named("db-host").using().value("localhost")
-        module.make(int).named("db-port").using().value(5432)
-        module.make(str).named("db-name").using().value("myapp")
-        module.make(str).named("connection").using().func(create_connection_string)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        connection_string = injector.produce(injector.plan(planner_input)).get(
-            DIKey.of(str, "connection")
-        )
-
-        self.assertEqual(connection_string, "postgresql://localhost:5432/myapp")
-
-    def test_annotated_dataclass_injection(self):
-        """Test dataclass injection with Annotated types."""
-
-        @dataclass
-        class Config:
-            host: Annotated[str, Id("server-host")]
-            port: Annotated[int, Id("server-port")]
-            debug: bool = False
-
-        module = ModuleDef()
-        module.make(str).named("server-host").using().value("0.0.0.0")
-        module.make(int).named("server-port").using().value(8080)
-        module.make(Config).using().type(Config)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        config = injector.produce(injector.plan(planner_input)).get(DIKey.of(Config))
-
-        self.assertEqual(config.host, "0.0.0.0")
-        self.assertEqual(config.port, 8080)
-        self.assertEqual(config.debug, False)  # Default value
-
-    def test_mixed_named_and_unnamed_dependencies(self):
-        """Test mixing named and unnamed dependencies."""
-
-        class Logger:
-            def __init__(self, name: str):
-                self.name = name
-
-        class Service:
-            def __init__(
-                self,
-                logger: Logger,
-                api_key: Annotated[str, Id("api-key")],
-                timeout: Annotated[int, Id("timeout")],
-            ):
-                self.logger = logger
-                self.api_key = api_key
-                self.timeout = timeout
-
-        module = ModuleDef()
-        module.make(Logger).using().value(Logger("default-logger"))
-        module.make(str).named("api-key").using().value("secret-key-123")
-        module.make(int).named("timeout").using().value(30)
-        module.make(Service).using().type(Service)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        service = injector.produce(injector.plan(planner_input)).get(DIKey.of(Service))
-
-        self.assertEqual(service.logger.name, "default-logger")
-        self.assertEqual(service.api_key, "secret-key-123")
-        self.assertEqual(service.timeout, 30)
+    def test_bind_shortcuts_match_fluent_bindings(self):
+        """Test that the bind_* shortcuts add the same bindings as the fluent builder chain."""
+
+        def create_string() -> str:
+            return "created"
+
+        fluent = ModuleDef()
+        fluent.make(str).named("primary").using().value("primary-string")
+        fluent.make(int).using().type(int)
+        fluent.make(str).named("created").using().func(create_string)
+
+        shortcut = ModuleDef()
+        shortcut.bind_value(str, "primary-string", name="primary")
+        shortcut.bind_type(int, int)
+        shortcut.bind_func(str, create_string, name="created")
+
+        self.assertEqual(shortcut.version, fluent.version)
+        for actual, expected in zip(shortcut.bindings, fluent.bindings, strict=True):
+            self.assertIs(actual.key, expected.key)
+            self.assertEqual(actual.activation_tags, expected.activation_tags)
+            self.assertEqual(actual.is_factory, expected.is_factory)
+            self.assertIs(actual.functoid.original_class, expected.functoid.original_class)
+            self.assertIs(actual.functoid.original_func, expected.functoid.original_func)
+        self.assertEqual(self._produce(shortcut).get(DIKey.of(str, "primary")), "primary-string")
+
+    def test_named_injection_cases(self):
+        """Test named injection into constructors, dataclasses, factories and Locator.run."""
+        for name, module, read, expected in _NAMED_INJECTION_CASES:
+            with self.subTest(case=name):
+                self.assertEqual(read(self._produce(module)), expected)
 
     def test_produce_run_with_named_dependencies(self):
         """Test produce_run with named dependencies."""
 
         def my_application(
-            database_url: Annotated[str, Id("db-url")],
+            database_url: DB_URL,
             redis_url: Annotated[str, Id("redis-url")],
             app_name: str,  # Unnamed dependency
         ) -> str:
             return f"App '{app_name}' connecting to DB: {database_url}, Redis: {redis_url}"
 
         module = ModuleDef()
-        module.make(str).named("db-url").using().value("postgresql://localhost/app")
-        module.make(str).named("redis-url").using().value("redis://localhost:6379")
-        module.make(str).using().value("MyApplication")  # Unnamed binding
+        module.bind_value(str, "postgresql://localhost/app", name="db-url")
+        module.bind_value(str, "redis://localhost:6379", name="redis-url")
+        module.bind_value(str, "MyApplication")  # Unnamed binding
 
-        injector = Injector()
         planner_input = PlannerInput([module])
-        result = injector.produce_run(planner_input, my_application)
+        result = self.injector.produce_run(planner_input, my_application)
 
         expected = "App 'MyApplication' connecting to DB: postgresql://localhost/app, Redis: redis://localhost:6379"
         self.assertEqual(result, expected)
 
-    def test_locator_run_with_named_dependencies(self):
-        """Test Locator.run with named dependencies."""
-
-        def worker_function(
-            worker_id: Annotated[str, Id("worker-id")], batch_size: Annotated[int, Id("batch-size")]
-        ) -> str:
-            return f"Worker {worker_id} processing {batch_size} items"
-
-        module = ModuleDef()
-        module.make(str).named("worker-id").using().value("worker-001")
-        module.make(int).named("batch-size").using().value(100)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        plan = injector.plan(planner_input)
-        locator = injector.produce(plan)
-
-        result = locator.run(worker_function)
-        self.assertEqual(result, "Worker worker-001 processing 100 items")
-
     def test_error_on_missing_named_dependency(self):
         """Test error when a named dependency is missing."""
 
@@ -227,16 +317,15 @@ class TestNamedDependencies(unittest.TestCase):
                 self.config = config
 
         module = ModuleDef()
-        module.make(Service).using().type(Service)
+        module.bind_type(Service, Service)
         # Note: not binding the "missing-config" name
 
-        injector = Injector()
         planner_input = PlannerInput([module])
 
         from izumi.distage.model.graph import MissingBindingError
 
         with self.assertRaises(MissingBindingError) as cm:
-            injector.produce(injector.plan(planner_input)).get(DIKey.of(Service))
+            self.injector.produce(self.injector.plan(planner_input)).get(DIKey.of(Service))
 
         error_message = str(cm.exception)
         self.assertIn("No binding found", error_message)
@@ -255,13 +344,11 @@ class TestNamedDependencies(unittest.TestCase):
                 self.optional = optional
 
         module = ModuleDef()
-        module.make(str).named("required").using().value("required-value")
+        module.bind_value(str, "required-value", name="required")
         # Note: not binding "optional" - should use default
-        module.make(Service).using().type(Service)
+        module.bind_type(Service, Service)
 
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        service = injector.produce(injector.plan(planner_input)).get(DIKey.of(Service))
+        service = self._produce(module).get(DIKey.of(Service))
 
         self.assertEqual(service.required, "required-value")
         self.assertEqual(service.optional, "default")
@@ -270,7 +357,7 @@ class TestNamedDependencies(unittest.TestCase):
         """Test complex scenario with nested named dependencies."""
 
         class Database:
-            def __init__(self, url: Annotated[str, Id("db-url")]):
+            def __init__(self, url: DB_URL):
                 self.url = url
 
         class Cache:
@@ -294,45 +381,23 @@ class TestNamedDependencies(unittest.TestCase):
                 self.version = version
 
         module = ModuleDef()
-        module.make(str).named("db-url").using().value("postgresql://localhost/users")
-        module.make(str).named("cache-url").using().value("redis://localhost:6379")
-        module.make(str).named("app-name").using().value("UserApp")
-        module.make(str).named("app-version").using().value("1.0.0")
-        module.make(Database).using().type(Database)
-        module.make(Cache).using().type(Cache)
-        module.make(UserService).using().type(UserService)
-        module.make(Application).using().type(Application)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        app = injector.produce(injector.plan(planner_input)).get(DIKey.of(Application))
+        module.bind_value(str, "postgresql://localhost/users", name="db-url")
+        module.bind_value(str, "redis://localhost:6379", name="cache-url")
+        module.bind_value(str, "UserApp", name="app-name")
+        module.bind_value(str, "1.0.0", name="app-version")
+        module.bind_type(Database, Database)
+        module.bind_type(Cache, Cache)
+        module.bind_type(UserService, UserService)
+        module.bind_type(Application, Application)
+
+        app, database = self._produce(module).get_many([DIKey.of(Application), DIKey.of(Database)])
 
         self.assertEqual(app.app_name, "UserApp")
         self.assertEqual(app.version, "1.0.0")
-        self.assertEqual(app.user_service.database.url, "postgresql://localhost/users")
+        self.assertIs(app.user_service.database, database)
+        self.assertEqual(database.url, "postgresql://localhost/users")
         self.assertEqual(app.user_service.cache.url, "redis://localhost:6379")
 
-    def test_lambda_factory_with_named_dependencies(self):
-        """Test lambda factory functions with named dependencies."""
-
-        module = ModuleDef()
-        module.make(str).named("prefix").using().value("LOG")
-        module.make(str).named("level").using().value("INFO")
-
-        # Factory function that uses named dependencies
-        def create_log_format(
-            prefix: Annotated[str, Id("prefix")], level: Annotated[str, Id("level")]
-        ) -> str:
-            return f"[{prefix}:{level}]"
-
-        module.make(str).named("log-format").using().func(create_log_format)
-
-        injector = Injector()
-        planner_input = PlannerInput([module])
-        log_format = injector.produce(injector.plan(planner_input)).get(DIKey.of(str, "log-format"))
-
-        self.assertEqual(log_format, "[LOG:INFO]")
-
 
 if __name__ == "__main__":
     unittest.main()